@@ -11,7 +11,7 @@ from sklearn.datasets import (
     fetch_olivetti_faces,
 )
 from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import pairwise_dists
+from sklearn.metrics import pairwise_distances
 
 
 
@@ -49,7 +49,7 @@ def k_center_cost(X, centers_idx):
 
 
 def hochbaum_shmoys(X, k):
-    dists = pairwise_dists(X)
+    dists = pairwise_distances(X)
     n = len(dists)
     all_dists = np.unique(dists)
     all_dists = all_dists[all_dists > 0] 
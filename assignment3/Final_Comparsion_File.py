@@ -10,31 +10,27 @@
 
 import networkx as nx
 import matplotlib.pyplot as plt
-from itertools import combinations
+import math
 import time
-import csv
 import os
-
-
-def read_graph(filename):
-    G = nx.Graph()
-    try:
-        with open(filename, 'r') as file:
-            n, m = map(int, file.readline().split())
-            for _ in range(m):
-                u, v = map(int, file.readline().split())
-                G.add_edge(u, v)
-    except IOError:
-        print(f"Error opening file: {filename}")
-        return None
-    return G
-
-
-def generate_subsets(v):  # geek for geeks
-    subsets = []
-    for r in range(len(v) + 1):
-        subsets.extend(combinations(v, r))  # array of tuples
-    return subsets
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from beyondpoly.baselines import record
+from beyondpoly.batched import batched_smallest_vertex_cover
+from beyondpoly.bitmask import smallest_vertex_cover as exhaustive_vertex_cover
+from beyondpoly.components import COMPONENTS_MODE, run_solver
+from beyondpoly.fpt import min_vertex_cover
+from beyondpoly.graph import as_networkx
+from beyondpoly.graphio import read_compact_graph, read_graph, read_graph_size
+from beyondpoly.instrument import current_run, dump_profile, new_run, phase
+from beyondpoly.layout import graph_layout
+from beyondpoly.lp import lp_kernel
+from beyondpoly.matching import greedy_vertex_cover
+from beyondpoly.parallel import parallel_smallest_vertex_cover
+from beyondpoly.plotting import graph_panel, plotting_enabled, render_figure, show, wait_for_renders
+from beyondpoly.resultcache import cached_solve
+from beyondpoly.sink import close_sinks, reset_output, result_sink
 
 
 def is_vertex_cover(G, subset):  # GEN AI PART
@@ -48,20 +44,7 @@ def is_vertex_cover(G, subset):  # GEN AI PART
     return covered_edges == all_edges
 
 
-def find_smallest_vertex_cover(G):
-    start = time.time()
-    vertices = list(G.nodes())
-    subsets = generate_subsets(vertices)
-
-    min_size = len(vertices) + 1
-    smallest_vertex_cover = []
-
-    for subset in subsets:
-        if is_vertex_cover(G, subset):
-            if len(subset) < min_size:
-                min_size = len(subset)
-                smallest_vertex_cover = subset
-
+def print_vertex_cover(smallest_vertex_cover):
     if smallest_vertex_cover:
         print("\nSmallest Vertex Cover:")
         print(smallest_vertex_cover)
@@ -69,106 +52,144 @@ def find_smallest_vertex_cover(G):
     else:
         print("\n No vertex cover found")
 
+
+def find_smallest_vertex_cover(G):
+    start = time.time()
+    # subsets come in increasing size, so the first cover found is a smallest one
+    smallest_vertex_cover = exhaustive_vertex_cover(G)
+
     end = time.time()
+
+    print_vertex_cover(smallest_vertex_cover)
     return smallest_vertex_cover, end-start
 
 
-def greedy_vertex_cover(G):
+def find_smallest_vertex_cover_fpt(G):
+    # kernelization + bounded search tree, same output as find_smallest_vertex_cover
     start = time.time()
+    cover = min_vertex_cover(G)
+    smallest_vertex_cover = tuple(v for v in G.nodes() if v in cover)
 
-    # Find a maximal matching
-    matching = nx.maximal_matching(G)
+    end = time.time()
+
+    print_vertex_cover(smallest_vertex_cover)
+    return smallest_vertex_cover, end-start
 
-    # Build the vertex cover from matched edges
-    cover = set()
-    for u, v in matching:
-        cover.add(u)
-        cover.add(v)
+
+def find_smallest_vertex_cover_parallel(G):
+    # exhaustive search over a process pool, same cover as find_smallest_vertex_cover
+    start = time.time()
+    workers = int(os.environ.get("VC_WORKERS", "0")) or None
+    smallest_vertex_cover = parallel_smallest_vertex_cover(G, workers=workers)
 
     end = time.time()
-    return list(cover), end - start
 
+    print_vertex_cover(smallest_vertex_cover)
+    return smallest_vertex_cover, end-start
 
-def plot_graph(G, axs, x, y, highlight_nodes=None, title="Graph", pos=None):
-    if not pos:
-        pos = nx.spring_layout(G, seed=42)  # fixed seed for consistent layout
 
-    ax = axs[x, y]
-    ax.clear()  # clear any previous drawing on the subplot
+def find_smallest_vertex_cover_batched(G):
+    # exhaustive search checking blocks of candidate masks in NumPy
+    start = time.time()
+    smallest_vertex_cover = batched_smallest_vertex_cover(G)
+
+    end = time.time()
 
-    nx.draw(G, pos, with_labels=True, node_color='lightblue',
-            edge_color='gray', node_size=400, ax=ax)
+    print_vertex_cover(smallest_vertex_cover)
+    return smallest_vertex_cover, end-start
 
-    if highlight_nodes:
-        nx.draw_networkx_nodes(
-            G, pos, nodelist=highlight_nodes, node_color='orange', node_size=400, ax=ax)
 
-    # ax parameter = tells NetworkX which subplot (Axes) to draw on.
-    ax.set_title(title)
-    ax.axis('off')  # optionally hide axis ticks
+def find_smallest_vertex_cover_lp(G):
+    # LP-guided: vertices at LP value 1 are fixed in, 0 fixed out, and only the
+    # 1/2-core is searched, starting from its LP lower bound (beyondpoly/lp.py)
+    start = time.time()
+    G = as_networkx(G)
+    forced, core = lp_kernel(G)
+    print(f"LP fixed {len(forced)} vertices, exact search on a core of {len(core)}")
+    chosen = set(forced)
+    core_graph = G.subgraph(core)
+    # each component of the core is searched on its own, from its own LP bound
+    for component in nx.connected_components(core_graph):
+        chosen.update(exhaustive_vertex_cover(core_graph.subgraph(component), math.ceil(len(component) / 2)))
+    smallest_vertex_cover = tuple(v for v in G.nodes() if v in chosen)
+
+    end = time.time()
+
+    print_vertex_cover(smallest_vertex_cover)
+    return smallest_vertex_cover, end-start
+
+
+# exact solver used by main(), pick with VC_EXACT_SOLVER=bruteforce|fpt|parallel|batched|lp
+EXACT_SOLVERS = {
+    "bruteforce": find_smallest_vertex_cover,
+    "fpt": find_smallest_vertex_cover_fpt,
+    "parallel": find_smallest_vertex_cover_parallel,
+    "batched": find_smallest_vertex_cover_batched,
+    "lp": find_smallest_vertex_cover_lp,
+}
+EXACT_SOLVER = os.environ.get("VC_EXACT_SOLVER", "bruteforce")
+
+
+# VC_COMPACT=1 loads inputs as array-backed CompactGraphs instead of networkx graphs
+GRAPH_LOADER = read_compact_graph if os.environ.get("VC_COMPACT", "0") == "1" else read_graph
+
+
+def plot_graph(G, panels, x, y, highlight_nodes=None, title="Graph", pos=None):
+    # records the drawing for grid cell (x, y); the whole grid is drawn once by render_figure
+    if not plotting_enabled():
+        return pos
+    if not pos:
+        pos = graph_layout(G)  # fixed seed, cached on disk for consistent layout
+
+    panels.append(graph_panel(G, pos, highlight_nodes, title, row=x, col=y))
 
     return pos
 
 
 
 def writeoutput_bruteforce(solution, time_taken, m, n):
-    fileEmptyCheck = (not os.path.exists("bruteforce_output.csv")) or (
-        os.path.getsize("bruteforce_output.csv") == 0)
-
-    if fileEmptyCheck:
-        with open("bruteforce_output.csv", 'w', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow(["Input size", "Solution", "Time Taken"])
-            writer.writerow([f"{m},{n}", solution, time_taken])
-    else:
-        with open("bruteforce_output.csv", 'a', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow([f"{m},{n}", solution, time_taken])
+    # buffered, see beyondpoly/sink.py
+    return result_sink("bruteforce_output.csv").add(
+        {"Input size": f"{m},{n}", "Solution": solution, "Time Taken": time_taken})
 
 
 def writeoutput_greedy(solution, time, m, n, sol_len, approxfactor):
-    fileEmptyCheck = (not os.path.exists("greedy_output.csv")) or (
-        os.path.getsize("greedy_output.csv") == 0)
-
-    if fileEmptyCheck:
-        with open("greedy_output.csv", 'w', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow(["Input size", "Solution", "Solution Length", "Time Taken", "Approximation Factor"])
-            writer.writerow([f"{m},{n}", solution,sol_len, time, approxfactor])
-            
-    else:
-        with open("greedy_output.csv", 'a', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow([f"{m},{n}", solution, sol_len, time, approxfactor])
-
+    return result_sink("greedy_output.csv").add(
+        {"Input size": f"{m},{n}", "Solution": solution, "Solution Length": sol_len,
+         "Time Taken": time, "Approximation Factor": approxfactor})
 
 
 # Main function
 def main():
-    if os.path.exists("bruteforce_output.csv"):
-        os.remove("bruteforce_output.csv")
-    if os.path.exists("greedy_output.csv"):
-        os.remove("greedy_output.csv")
-
-    fig, axs = plt.subplots(nrows=2, ncols=2, figsize=(12, 10))
-    fig2, axs2 = plt.subplots(nrows=2, ncols=2, figsize=(12, 10))
-    fig3, axs3 = plt.subplots(nrows=2, ncols=2, figsize=(12, 10))
+    reset_output("bruteforce_output.csv")
+    reset_output("greedy_output.csv")
+    reset_output("phase_summary.csv")
+
+    panels, panels2, panels3 = [], [], []
     
     timebruteforce=[]
     timegreedy=[]
+    x_labels=[]
 
     for i in range(1, 5):
         filename = f"input{i}.txt"
-        G = read_graph(filename)
+        new_run()
+        with phase("parse"):
+            G = GRAPH_LOADER(filename)
         if G is None:
             return
 
         x = (i - 1) // 2
         y = (i - 1) % 2
 
-        position = plot_graph(G, axs, x, y, title=f"Original Graph {i}")
+        with phase("plot"):
+            position = plot_graph(G, panels, x, y, title=f"Original Graph {i}")
 
-        Solution_bruteforce, time_taken_bruteforce = find_smallest_vertex_cover(G) # brute force
+        with phase("exact_solve"):
+            # exact results are memoized on disk, VC_NO_CACHE=1 forces a fresh solve
+            Solution_bruteforce, time_taken_bruteforce = cached_solve(
+                G, EXACT_SOLVER, lambda G: run_solver(G, EXACT_SOLVERS[EXACT_SOLVER]),
+                params={"components": COMPONENTS_MODE}) # brute force
         bruteforce_sol_len=len(Solution_bruteforce)
         
         timebruteforce.append(time_taken_bruteforce)
@@ -177,78 +198,80 @@ def main():
         print(f"Size: {bruteforce_sol_len}, Time: {time_taken_bruteforce}s")
         print()
         
-        Solution_greedy, time_taken_greedy = greedy_vertex_cover(G) # greedy solution
+        with phase("greedy_solve"):
+            Solution_greedy, time_taken_greedy = run_solver(G, greedy_vertex_cover) # greedy solution
         greedy_sol_len=len(Solution_greedy)
         
         print(f"Greedy Vertex Cover: {Solution_greedy}")
         print(f"Size: {greedy_sol_len}, Time: {time_taken_greedy}s")
         
         approxfactor=greedy_sol_len/bruteforce_sol_len
+        # later runs of greedyvc / LProunding look these sizes up by graph
+        record(G, "optimal", bruteforce_sol_len, source=filename)
+        record(G, "greedy_matching", greedy_sol_len, source=filename)
         
         timegreedy.append(time_taken_greedy)
         
         print(f"approximation factor(comparison with bruteforce results): {approxfactor} ")
 
-        plot_graph(G, axs2, x, y, highlight_nodes=Solution_bruteforce,
-                   title=f"Vertex Cover {i}", pos=position)
-        
+        with phase("verify"):
+            if not (is_vertex_cover(G, Solution_bruteforce) and is_vertex_cover(G, Solution_greedy)):
+                print("warning: a returned solution is not a vertex cover")
 
-        plot_graph(G, axs3, x, y, highlight_nodes=Solution_greedy,
-                   title=f"Vertex Cover {i}", pos=position)
+        with phase("plot"):
+            plot_graph(G, panels2, x, y, highlight_nodes=Solution_bruteforce,
+                       title=f"Vertex Cover {i}", pos=position)
+
+            plot_graph(G, panels3, x, y, highlight_nodes=Solution_greedy,
+                       title=f"Vertex Cover {i}", pos=position)
         
         
         
-        if i == 1:
-            writeoutput_bruteforce(Solution_bruteforce, time_taken_bruteforce, 20, 20)
-            
-            writeoutput_greedy(Solution_greedy, time_taken_greedy, 20, 20,greedy_sol_len,approxfactor)
-
-        elif i == 2:
-            writeoutput_bruteforce(Solution_bruteforce, time_taken_bruteforce, 20, 30)
-            
-            writeoutput_greedy(Solution_greedy, time_taken_greedy, 20, 30,greedy_sol_len,approxfactor)
-
-        elif i == 3:
-            writeoutput_bruteforce(Solution_bruteforce, time_taken_bruteforce, 20, 40)
-            
-            writeoutput_greedy(Solution_greedy, time_taken_greedy, 20, 40,greedy_sol_len,approxfactor)
-
-        elif i == 4:
-            writeoutput_bruteforce(Solution_bruteforce, time_taken_bruteforce, 20, 50)
-            
-            writeoutput_greedy(Solution_greedy, time_taken_greedy, 20, 50,greedy_sol_len,approxfactor)
+        n, m = read_graph_size(filename)
+        x_labels.append(f"{n} {m}")
+        with phase("write"):
+            rows = [writeoutput_bruteforce(Solution_bruteforce, time_taken_bruteforce, n, m),
+                    writeoutput_greedy(Solution_greedy, time_taken_greedy, n, m, greedy_sol_len, approxfactor)]
+        phases = current_run().as_row()  # after the write phase closed, so write_s is in
+        for row in rows:
+            row.update(phases)
             
         
 
-    fig.suptitle("Original Graphs")
-    fig2.suptitle("Graphs Highlighting Smallest Vertex Cover BRUTE FORCE solution")
-    fig3.suptitle("Graphs Highlighting Vertex Cover GREEDY solution")
-    fig.savefig("inputgraph.png")
-    fig2.savefig("output_bruteforce.png")
-    fig3.savefig("output_greedy.png")
-    
-        
-    x_labels = ["20 20", "20 30", "20 40", "20 50"]
-    
-    plt.figure(figsize=(8, 4))
-    plt.plot(x_labels, timebruteforce, marker='o', linestyle='-', color="blue", label="Brute Force")
-    plt.xlabel("Input Graph Size")
-    plt.ylabel("Time (seconds)")
-    plt.title("Brute Force Execution Time")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig("time_bruteforce.png")
-
-    plt.figure(figsize=(8, 4))
-    plt.plot(x_labels, timegreedy, marker='s', linestyle='--', color="green", label="Greedy")
-    plt.xlabel("Input Graph Size")
-    plt.ylabel("Time (seconds)")
-    plt.title("Greedy Execution Time")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig("time_greedy.png")
-
-    plt.show()
+    # the 2x2 grids and time plots are drawn once for all inputs, so their
+    # cost is timed as a run of its own and written to phase_summary.csv
+    figures = new_run()
+    with phase("plot"):
+        render_figure("inputgraph.png", panels, 2, 2, (12, 10), "Original Graphs")
+        render_figure("output_bruteforce.png", panels2, 2, 2, (12, 10),
+                      "Graphs Highlighting Smallest Vertex Cover BRUTE FORCE solution")
+        render_figure("output_greedy.png", panels3, 2, 2, (12, 10),
+                      "Graphs Highlighting Vertex Cover GREEDY solution")
+
+        if plotting_enabled():
+            plt.figure(figsize=(8, 4))
+            plt.plot(x_labels, timebruteforce, marker='o', linestyle='-', color="blue", label="Brute Force")
+            plt.xlabel("Input Graph Size")
+            plt.ylabel("Time (seconds)")
+            plt.title("Brute Force Execution Time")
+            plt.legend()
+            plt.tight_layout()
+            plt.savefig("time_bruteforce.png")
+
+            plt.figure(figsize=(8, 4))
+            plt.plot(x_labels, timegreedy, marker='s', linestyle='--', color="green", label="Greedy")
+            plt.xlabel("Input Graph Size")
+            plt.ylabel("Time (seconds)")
+            plt.title("Greedy Execution Time")
+            plt.legend()
+            plt.tight_layout()
+            plt.savefig("time_greedy.png")
+        wait_for_renders()  # background mode: the pool finishes the PNGs here
+    result_sink("phase_summary.csv").add({"Run": "figures", **figures.as_row()})
+
+    close_sinks()
+    dump_profile()
+    show()
 
 
 if __name__ == "__main__":
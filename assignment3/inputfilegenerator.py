@@ -1,10 +1,14 @@
  
 # Gen Ai
  
-import random
+import os
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from beyondpoly.generators import gnm_edges, write_edge_list
 
-def generate_graph_input(filename, n, m):
+
+def generate_graph_input(filename, n, m, seed=None):
     """
     Generates a random undirected graph input file.
 
@@ -12,24 +16,14 @@ def generate_graph_input(filename, n, m):
         filename (str): Output filename.
         n (int): Number of vertices.
         m (int): Number of edges.
+        seed (int): Seed for a reproducible file; None gives a fresh graph.
 
-    The vertices are numbered from 0 to n-1.
+    The vertices are numbered from 0 to n-1. Edges are sampled without
+    replacement in NumPy (see beyondpoly/generators.py for the other models)
+    and written in one go.
     """
-    if m > n * (n - 1) // 2:
-        raise ValueError("Too many edges for given number of vertices.")
-
-    edges = set()
-    while len(edges) < m:
-        u = random.randint(0, n - 1)
-        v = random.randint(0, n - 1)
-        if u != v:
-            edge = tuple(sorted((u, v)))  # avoid duplicates and self loops
-            edges.add(edge)
-
-    with open(filename, 'w') as f:
-        f.write(f"{n} {m}\n")
-        for u, v in edges:
-            f.write(f"{u} {v}\n")
+    u, v = gnm_edges(n, m, seed)  # raises ValueError when m > n(n-1)/2
+    write_edge_list(filename, n, u, v)
 
 if __name__ == "__main__":
     for i in range(1,5):
@@ -37,5 +31,5 @@ if __name__ == "__main__":
         m = 10*(i+1)  # number of edges
         output_file = f"input{i}.txt"
 
-        generate_graph_input(output_file, n, m)
+        generate_graph_input(output_file, n, m, seed=i)  # seeded by index, so reruns give the same files
         print(f"Generated graph input file '{output_file}' with {n} vertices and {m} edges.")
@@ -5,62 +5,91 @@ to maintain consistency
 run this file to see the results 
  '''
  
-# gen AI is used in one of the functions i.e ast library (Abstract Syntax Trees) 
-# used for parsing string to tuple/list
 
-
-import networkx as nx
-import matplotlib.pyplot as plt
 import time
-import csv
 import os
-import ast
+import sys
 
 import pulp
 from pulp import LpProblem, LpMinimize, LpVariable, lpSum
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from beyondpoly.baselines import approximation_factor, record
+from beyondpoly.components import COMPONENTS_MODE, run_solver
+from beyondpoly.graphio import read_compact_graph, read_graph_size
+from beyondpoly.instrument import current_run, dump_profile, new_run, phase
+from beyondpoly.layout import graph_layout
+from beyondpoly.lp import half_integral_lp, lp_relaxation, round_half
+from beyondpoly.plotting import graph_panel, plotting_enabled, render_figure, show, wait_for_renders
+from beyondpoly.resultcache import cached_solve
+from beyondpoly.sink import close_sinks, reset_output, result_sink
+
+
 
+# LP backend: VC_LP_BACKEND=pulp (default) builds a PuLP model and runs CBC,
+# VC_LP_BACKEND=highs solves the sparse LP in-process, VC_LP_BACKEND=halfint
+# reads a half-integral optimum off a bipartite matching (no LP solver at all),
+# see beyondpoly/lp.py
+LP_BACKEND = os.environ.get("VC_LP_BACKEND", "pulp")
 
-def read_graph(filename):
-    G = nx.Graph()
-    try:
-        with open(filename, 'r') as file:
-            n, m = map(int, file.readline().split())
-            for _ in range(m):
-                u, v = map(int, file.readline().split())
-                G.add_edge(u, v)
-    except IOError:
-        print(f"Error opening file: {filename}")
-        return None
-    return G
 
+def pulp_relaxation(G):
+    with phase("model_build"):
+        # Define LP problem
+        prob = LpProblem("LP_Relaxed_Vertex_Cover", LpMinimize)
+        
+        # Relax binary constraints → continuous between 0 and 1
+        x = {v: LpVariable(f"x_{v}", lowBound=0, upBound=1, cat='Continuous') for v in G.nodes()}
+        
+        # Objective: minimize sum of x[v]
+        prob += lpSum(x[v] for v in G.nodes())
+        
+        # Constraints: for each edge, at least one endpoint should be covered
+        for u, v in G.edges():
+            prob += x[u] + x[v] >= 1
+    
+    with phase("solve"):
+        # Solve LP
+        prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    
+    with phase("rounding"):
+        # Fractional solution
+        fractional_sol = {v: pulp.value(x[v]) for v in G.nodes()}
+        
+        # Rounding heuristic: if x[v] >= 0.5 → select that vertex
+        cover = [v for v in G.nodes() if fractional_sol[v] >= 0.5]
+    return fractional_sol, cover
 
 
+def highs_relaxation(G):
+    # incidence matrix built from the edge arrays, solved by HiGHS in this process
+    with phase("solve"):
+        labels, x = lp_relaxation(G)
+    with phase("rounding"):
+        fractional_sol = dict(zip(labels.tolist(), x.tolist()))
+        cover = round_half(labels, x)
+    return fractional_sol, cover
+
+
+def halfint_relaxation(G):
+    # Nemhauser-Trotter: Hopcroft-Karp matching on the bipartite double cover
+    with phase("solve"):
+        labels, x = half_integral_lp(G)
+    with phase("rounding"):
+        fractional_sol = dict(zip(labels.tolist(), x.tolist()))
+        cover = round_half(labels, x)
+    return fractional_sol, cover
+
 
 def greedy_vertex_cover(G):
     start = time.time()
-    
-    # Define LP problem
-    prob = LpProblem("LP_Relaxed_Vertex_Cover", LpMinimize)
-    
-    # Relax binary constraints → continuous between 0 and 1
-    x = {v: LpVariable(f"x_{v}", lowBound=0, upBound=1, cat='Continuous') for v in G.nodes()}
-    
-    # Objective: minimize sum of x[v]
-    prob += lpSum(x[v] for v in G.nodes())
-    
-    # Constraints: for each edge, at least one endpoint should be covered
-    for u, v in G.edges():
-        prob += x[u] + x[v] >= 1
-    
-    # Solve LP
-    prob.solve(pulp.PULP_CBC_CMD(msg=False))
-    
-    # Fractional solution
-    fractional_sol = {v: pulp.value(x[v]) for v in G.nodes()}
-    
-    # Rounding heuristic: if x[v] >= 0.5 → select that vertex
-    cover = [v for v in G.nodes() if fractional_sol[v] >= 0.5]
+
+    if LP_BACKEND == "highs":
+        fractional_sol, cover = highs_relaxation(G)
+    elif LP_BACKEND == "halfint":
+        fractional_sol, cover = halfint_relaxation(G)
+    else:
+        fractional_sol, cover = pulp_relaxation(G)
     
     end = time.time()
     
@@ -78,114 +107,85 @@ def greedy_vertex_cover(G):
 # print("Time taken:", duration)
 
 
+
 def plot_graph(G, highlight_nodes=None, title="Graph", pos=None, number=None):
+    if not plotting_enabled():
+        return pos
     if not pos:
-        pos = nx.spring_layout(G)
+        pos = graph_layout(G)  # seeded and cached, see beyondpoly/layout.py
 
     
     # fixed layout for consistency , can also pass a seed as attribute for consistency across the devices 
     # pos above return the dictionary position of each vertex 
     # print(pos)
     
-    plt.figure(figsize=(8, 6))
-
-    nx.draw(G, pos, with_labels=True, node_color='lightblue',
-            edge_color='gray', node_size=700)
-
-    if highlight_nodes:
-        nx.draw_networkx_nodes(
-            G, pos, nodelist=highlight_nodes, node_color='orange', node_size=900)
-    plt.title(title)
-
-    if highlight_nodes:
-        plt.savefig(f"output{number}.png")
-    plt.show()
+    path = f"output{number}.png" if highlight_nodes else None
+    render_figure(path, [graph_panel(G, pos, highlight_nodes, title, node_size=700, highlight_size=900)])
+    show()
 
     return pos
 
 
 def writeoutput(solution, time, m, n, sol_len, approxfactor):
-    fileEmptyCheck = (not os.path.exists("output.csv")) or (
-        os.path.getsize("output.csv") == 0)
-
-    if fileEmptyCheck:
-        with open("output.csv", 'w', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow(["Input size", "Solution", "Solution Length", "Time Taken", "Approximation Factor"])
-            writer.writerow([f"{m},{n}", solution,sol_len, time, approxfactor])
-            
-    else:
-        with open("output.csv", 'a', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow([f"{m},{n}", solution, sol_len, time, approxfactor])
-
-
-def calculate_approxfactor(index, lplen , filename="previous_outputs.csv"):
-    
-    fileEmptyCheck = (not os.path.exists(filename)) or (os.path.getsize(filename) == 0)
+    # buffered, see beyondpoly/sink.py
+    return result_sink("output.csv").add({"Input size": f"{m},{n}", "Solution": solution, "Solution Length": sol_len,
+                                   "Time Taken": time, "Approximation Factor": approxfactor})
 
-    if fileEmptyCheck :
-        print(f"error: {filename} not found. .")
-        return
-    
-    greedy_sol_len=0
-    with open(filename, 'r') as file:
-        csv_reader = csv.reader(file)
-        csv_reader=list(csv_reader)
-        
-        greedy_sol_len=len(ast.literal_eval(csv_reader[index][1])) # GEN AI USED HERE
-    
-    return greedy_sol_len ,lplen/greedy_sol_len
-        
 
+def calculate_approxfactor(G, lplen, filename="previous_outputs.csv"):
+    # greedy size from the baseline store, keyed by the graph itself;
+    # the old greedy CSV is imported into the store the first time it is needed
+    greedy_sol_len, approxfactor = approximation_factor(G, lplen, "greedy_matching", legacy_csv=filename)
+    if greedy_sol_len is None:
+        print(f"error: no greedy solution recorded for this graph (baseline store or {filename})")
+    return greedy_sol_len, approxfactor
 
 
 def main():
-    if os.path.exists("output.csv"):
-        os.remove("output.csv")
+    reset_output("output.csv")
 
     for i in range(1, 9):
         filename = f"input{i}.txt"
-        G = read_graph(filename)
+        new_run()
+        with phase("parse"):
+            G = read_compact_graph(filename)  # CompactGraph; plotting converts it when drawing
         if G is None:
             return
 
 
         print(f"\nGraph from {filename}")
-        pos = plot_graph(G, title="Original Graph") # saving the position of input graph before showing the output
+        with phase("plot"):
+            pos = plot_graph(G, title="Original Graph") # saving the position of input graph before showing the output
         
-        solution, time_taken = greedy_vertex_cover(G)
+        # model_build, solve and rounding are timed inside greedy_vertex_cover
+        solution, time_taken = cached_solve(G, "lp_rounding", lambda G: run_solver(G, greedy_vertex_cover),
+                                            params={"components": COMPONENTS_MODE, "lp_backend": LP_BACKEND})
         sol_len=len(solution)
         
         print(f"Greedy Vertex Cover: {solution}")
         print(f"Size: {sol_len}, Time: {time_taken}s")
-        optimalsol_len, approxfactor=calculate_approxfactor(i,sol_len)
+        optimalsol_len, approxfactor=calculate_approxfactor(G, sol_len)
+        record(G, "lp_rounding", sol_len, source=filename)
         print(f"optimal solution length from assignment one: {optimalsol_len} ")
         print(f"approximation factor(comparison with prac 1 results): {approxfactor} ")
         
         
-        plot_graph(G, highlight_nodes=solution, title="Graph with Greedy Vertex Cover", pos=pos, number=i)
-
-        if i == 1:
-            writeoutput(solution, time_taken, 10, 10,sol_len,approxfactor)
-        elif i == 2:
-            writeoutput(solution, time_taken, 10, 20,sol_len,approxfactor)
-        elif i == 3:
-            writeoutput(solution, time_taken, 10, 30,sol_len,approxfactor)
-        elif i == 4:
-            writeoutput(solution, time_taken, 10, 40,sol_len,approxfactor)
-        elif i == 5:
-            writeoutput(solution, time_taken, 20, 20,sol_len,approxfactor)
-
-        elif i == 6:
-            writeoutput(solution, time_taken, 20, 30,sol_len,approxfactor)
-
-        elif i == 7:
-  
-            writeoutput(solution, time_taken, 20, 40,sol_len,approxfactor)
-
-        elif i == 8:
-            writeoutput(solution, time_taken, 20, 50,sol_len,approxfactor)            
+        with phase("verify"):
+            chosen = set(solution)
+            if not all(u in chosen or v in chosen for u, v in G.edges()):
+                print("warning: rounded solution is not a vertex cover")
+
+        with phase("plot"):
+            plot_graph(G, highlight_nodes=solution, title="Graph with Greedy Vertex Cover", pos=pos, number=i)
+
+        n, m = read_graph_size(filename)
+        with phase("write"):
+            row = writeoutput(solution, time_taken, n, m, sol_len, approxfactor)
+        row.update(current_run().as_row())  # after the write phase closed, so write_s is in
+
+    close_sinks()
+    dump_profile()
+    wait_for_renders()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,12 @@
+"""
+Shared helpers for the vertex cover and k-center assignments.
+
+The assignment scripts add the repository root to sys.path and import from
+here, so each folder keeps running on its own with `python <script>.py`.
+"""
+
+import os
+
+
+# repository root; the on-disk caches and the baseline store default to it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
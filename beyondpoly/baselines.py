@@ -0,0 +1,153 @@
+"""
+SQLite store of baseline cover sizes, for approximation factors.
+
+One row per (graph_key, algorithm), where graph_key is graph.graph_key, the
+content hash of the edge list. The pair is the primary key, so a lookup is a
+single indexed read. It does not depend on file names or row order. Sizes are
+stored as integers and never re-derived from a printed solution.
+
+A stored baseline is never replaced by a later record(): several scripts
+record greedy_matching for the same inputs, and an approximation factor must
+not depend on which of them ran last. Use `import --replace` (or
+replace=True) to overwrite one on purpose.
+
+Algorithms recorded by the scripts:
+    optimal          any exact solver
+    greedy_matching  the matching 2-approximation
+    lp_rounding      LP relaxation rounded at 1/2
+
+The database is baselines.sqlite at the repository root, or VC_BASELINE_DB.
+Older CSV outputs can be loaded once with import_csv.
+
+Usage:
+    python -m beyondpoly.baselines import vertexcoverapproximation/assignment1_output.csv optimal
+    python -m beyondpoly.baselines show
+"""
+
+import argparse
+import ast
+import csv
+import os
+import sqlite3
+from contextlib import closing
+
+from beyondpoly import ROOT
+from beyondpoly.graph import graph_key
+from beyondpoly.graphio import read_compact_graph
+
+
+DB_PATH = os.environ.get("VC_BASELINE_DB", os.path.join(ROOT, "baselines.sqlite"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS baselines (
+    graph_key TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    n INTEGER,
+    m INTEGER,
+    source TEXT,
+    PRIMARY KEY (graph_key, algorithm)
+)
+"""
+
+
+def connect(path=None):
+    db = sqlite3.connect(path or DB_PATH, timeout=30)
+    db.execute(SCHEMA)
+    return db
+
+
+def _key(G):
+    # accepts a graph or an already computed graph_key
+    return G if isinstance(G, str) else graph_key(G)
+
+
+def record(G, algorithm, size, source=None, path=None, replace=False):
+    # stores the cover size of algorithm on G unless one is stored already
+    key = _key(G)
+    if key is None:
+        return
+    n = m = None
+    if not isinstance(G, str):
+        n, m = G.number_of_nodes(), G.number_of_edges()
+    with closing(connect(path)) as db, db:
+        db.execute(f"INSERT OR {'REPLACE' if replace else 'IGNORE'} INTO baselines VALUES (?, ?, ?, ?, ?, ?)",
+                   (key, algorithm, int(size), n, m, source))
+
+
+def baseline_size(G, algorithm, path=None):
+    # stored cover size of algorithm on G, or None
+    key = _key(G)
+    if key is None:
+        return None
+    with closing(connect(path)) as db:
+        row = db.execute("SELECT size FROM baselines WHERE graph_key = ? AND algorithm = ?",
+                         (key, algorithm)).fetchone()
+    return row[0] if row else None
+
+
+def import_csv(filename, algorithm, input_name="input{}.txt", path=None, replace=False):
+    """
+    Loads an old results CSV, whose row i belongs to input{i}.txt next to it.
+
+    Uses the "Solution Length" column when the file has one. Otherwise it
+    parses the Solution column once here, so lookups never have to. Existing
+    baselines are kept unless replace is set.
+
+    Returns:
+        int: Number of rows stored.
+    """
+    folder = os.path.dirname(os.path.abspath(filename))
+    stored = 0
+    with open(filename, newline='') as file:
+        for i, row in enumerate(csv.DictReader(file), start=1):
+            graph_file = os.path.join(folder, input_name.format(i))
+            if not os.path.exists(graph_file):
+                continue
+            if row.get("Solution Length"):
+                size = int(row["Solution Length"])
+            else:
+                size = len(ast.literal_eval(row["Solution"]))
+            record(read_compact_graph(graph_file), algorithm, size, source=filename, path=path, replace=replace)
+            stored += 1
+    return stored
+
+
+def approximation_factor(G, size, algorithm, legacy_csv=None, path=None):
+    """
+    (baseline size, size / baseline) against the stored baseline of algorithm.
+
+    When there is no baseline yet and legacy_csv exists, that file is imported
+    first. Returns (None, None) when no baseline can be found.
+    """
+    key = _key(G)
+    baseline = baseline_size(key, algorithm, path)
+    if baseline is None and legacy_csv and os.path.exists(legacy_csv):
+        import_csv(legacy_csv, algorithm, path=path)
+        baseline = baseline_size(key, algorithm, path)
+    if not baseline:
+        return None, None
+    return baseline, size / baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the baseline cover size store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="load an old results CSV")
+    imp.add_argument("csv")
+    imp.add_argument("algorithm")
+    imp.add_argument("--input-name", default="input{}.txt")
+    imp.add_argument("--replace", action="store_true", help="overwrite baselines already stored")
+    sub.add_parser("show", help="list the stored baselines")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        print(f"stored {import_csv(args.csv, args.algorithm, args.input_name, replace=args.replace)} baselines")
+    else:
+        with closing(connect()) as db:
+            for row in db.execute("SELECT algorithm, n, m, size, graph_key FROM baselines ORDER BY algorithm, n, m"):
+                print(*row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Process-pool batch runner for many graph instances.
+
+Every (input file, solver) pair is one job, run in its own worker process so a
+job that overruns its timeout can be killed. At most `workers` jobs run at a
+time. Rows reach the output sink as jobs finish, not in file order, and the
+`n,m` size label comes from each file's header.
+
+Usage:
+    python -m beyondpoly.batch "assignment3/input*.txt" --solvers fpt,greedy \\
+        --workers 8 --timeout 60 --output batch_results.csv
+    python -m beyondpoly.batch --manifest graphs.txt --solvers batched
+"""
+
+import argparse
+import glob
+import multiprocessing as mp
+import os
+import time
+from multiprocessing.connection import wait
+
+from beyondpoly.batched import batched_smallest_vertex_cover
+from beyondpoly.bitmask import smallest_vertex_cover
+from beyondpoly.fpt import min_vertex_cover
+from beyondpoly.graphio import read_graph, read_graph_size
+from beyondpoly.matching import greedy_vertex_cover
+from beyondpoly.parallel import parallel_smallest_vertex_cover
+from beyondpoly.sink import ResultSink
+from beyondpoly.streaming import streaming_vertex_cover
+
+
+FIELDS = ["File", "Input size", "Solver", "Status", "Solution", "Solution Length", "Time Taken"]
+
+
+# solvers taking the loaded graph
+SOLVERS = {
+    "bruteforce": smallest_vertex_cover,
+    "batched": batched_smallest_vertex_cover,
+    "parallel": parallel_smallest_vertex_cover,
+    "fpt": lambda G: sorted(min_vertex_cover(G)),
+    "greedy": lambda G: sorted(greedy_vertex_cover(G)[0]),
+}
+
+# solvers reading the file themselves
+FILE_SOLVERS = {
+    "stream": lambda filename: streaming_vertex_cover(filename)[0].tolist(),
+}
+
+
+def collect_inputs(patterns=(), manifest=None):
+    # files matching the glob patterns plus those listed in the manifest, in order, once each
+    files = []
+    for pattern in patterns:
+        files.extend(sorted(glob.glob(pattern)))
+    if manifest:
+        with open(manifest) as listing:
+            base = os.path.dirname(os.path.abspath(manifest))
+            for line in listing:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    files.append(line if os.path.isabs(line) else os.path.join(base, line))
+    return list(dict.fromkeys(files))
+
+
+def _run_job(conn, filename, solver):
+    try:
+        start = time.perf_counter()
+        if solver in FILE_SOLVERS:
+            cover = FILE_SOLVERS[solver](filename)
+        else:
+            cover = SOLVERS[solver](read_graph(filename))
+        conn.send(("ok", list(cover), time.perf_counter() - start))
+    except Exception as e:
+        conn.send(("error", repr(e), None))
+    finally:
+        conn.close()
+
+
+def _row(filename, solver, status, solution, time_taken):
+    try:
+        n, m = read_graph_size(filename)
+        size = f"{n},{m}"
+    except (OSError, ValueError):
+        size = ""
+    length = len(solution) if status == "ok" else ""
+    return {"File": filename, "Input size": size, "Solver": solver, "Status": status,
+            "Solution": solution, "Solution Length": length, "Time Taken": time_taken}
+
+
+def run_batch(files, solvers, workers=None, timeout=None):
+    """
+    Runs every solver on every file and yields one result dict per job as it
+    finishes. Jobs past `timeout` seconds are terminated and reported with
+    status "timeout".
+    """
+    unknown = [s for s in solvers if s not in SOLVERS and s not in FILE_SOLVERS]
+    if unknown:
+        raise ValueError(f"Unknown solvers: {', '.join(unknown)}")
+
+    workers = workers or os.cpu_count()
+    pending = [(f, s) for f in files for s in solvers]
+    pending.reverse()
+    active = {}  # connection -> (process, filename, solver, start)
+
+    while pending or active:
+        while pending and len(active) < workers:
+            filename, solver = pending.pop()
+            recv, send = mp.Pipe(duplex=False)
+            proc = mp.Process(target=_run_job, args=(send, filename, solver))
+            proc.start()
+            send.close()
+            active[recv] = (proc, filename, solver, time.perf_counter())
+
+        for conn in wait(list(active), timeout=0.1):
+            proc, filename, solver, _ = active.pop(conn)
+            try:
+                status, solution, time_taken = conn.recv()
+            except EOFError:
+                status, solution, time_taken = "error", f"worker exited with code {proc.exitcode}", None
+            conn.close()
+            proc.join()
+            yield _row(filename, solver, status, solution, time_taken)
+
+        if timeout is not None:
+            now = time.perf_counter()
+            for conn, (proc, filename, solver, start) in list(active.items()):
+                if now - start > timeout:
+                    proc.terminate()
+                    proc.join()
+                    conn.close()
+                    del active[conn]
+                    yield _row(filename, solver, "timeout", "", now - start)
+
+
+def write_rows(rows, output):
+    # appends rows to a CSV as they arrive, in small batches so the file stays current
+    with ResultSink(output, FIELDS, batch_size=16, flush_seconds=1.0) as sink:
+        for row in rows:
+            sink.add(row)
+            print(f"{row['Status']:>7}  {row['Solver']:<10} {row['File']} ({row['Input size']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run vertex cover solvers over many graph files.")
+    parser.add_argument("patterns", nargs="*", help="glob patterns of input files")
+    parser.add_argument("--manifest", help="text file listing one input file per line")
+    parser.add_argument("--solvers", default="greedy",
+                        help=f"comma separated, from {', '.join([*SOLVERS, *FILE_SOLVERS])}")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per job")
+    parser.add_argument("--output", default="batch_results.csv")
+    args = parser.parse_args()
+
+    files = collect_inputs(args.patterns, args.manifest)
+    if not files:
+        parser.error("no input files matched")
+    write_rows(run_batch(files, args.solvers.split(","), args.workers, args.timeout), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+NumPy batched vertex cover checking.
+
+Candidate subsets are packed as uint64 masks (bit i = vertices[i]) and a whole
+block of them is tested edge by edge with ((mask >> u) | (mask >> v)) & 1, so the
+loop over candidates runs in NumPy instead of the interpreter. The masks
+themselves are also generated in NumPy from per-size lookup tables. Graphs are limited to 64 vertices, which is far beyond what
+exhaustive search can finish anyway.
+"""
+
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from beyondpoly.bitmask import subset_to_mask
+from beyondpoly.graph import CompactGraph
+
+
+BLOCK_SIZE = 4096
+TAIL_BUDGET = 1 << 18  # masks kept in the per-size tail lookup tables
+
+
+def edge_arrays(G, vertices):
+    # edge endpoints as bit positions into the candidate masks
+    if isinstance(G, CompactGraph) and vertices == G.nodes():
+        return G.eu.astype(np.uint64), G.ev.astype(np.uint64)
+    index = {v: i for i, v in enumerate(vertices)}
+    eu = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.uint64, count=G.number_of_edges())
+    ev = np.fromiter((index[v] for _, v in G.edges()), dtype=np.uint64, count=G.number_of_edges())
+    return eu, ev
+
+
+def is_vertex_cover_batch(masks, eu, ev):
+    """
+    Returns a bool array telling which masks in the block cover every edge.
+    """
+    one = np.uint64(1)
+    ok = np.ones(len(masks), dtype=bool)
+    # one pass per edge over the whole block keeps the temporaries at block size
+    for u, v in zip(eu, ev):
+        ok &= (((masks >> u) | (masks >> v)) & one).astype(bool)
+    return ok
+
+
+def _tail_depth(n, size):
+    # deepest tail whose lookup tables stay within TAIL_BUDGET masks
+    depth = 0
+    while depth < size and comb(n + 1, depth + 2) <= TAIL_BUDGET:
+        depth += 1
+    return depth
+
+
+def _tail_tables(n, depth, weights):
+    # tables[j]: masks of all depth-subsets of range(j, n), in combinations() order
+    row = [np.zeros(1, dtype=np.uint64)] * (n + 1)
+    for t in range(1, depth + 1):
+        prev = row
+        row = [np.zeros(0, dtype=np.uint64)] * (n + 1)
+        for j in range(n - t, -1, -1):
+            # subsets starting at j come first, then those of range(j + 1, n)
+            row[j] = np.concatenate((weights[j] | prev[j + 1], row[j + 1]))
+    return row
+
+
+def combination_masks(n, size, block_size=BLOCK_SIZE):
+    # blocks of masks for all size-subsets of range(n), in combinations() order;
+    # the first vertices come from a Python prefix, the rest from NumPy tail tables
+    weights = np.left_shift(np.uint64(1), np.arange(n, dtype=np.uint64))
+    depth = _tail_depth(n, size)
+    tails = _tail_tables(n, depth, weights)
+    pending, count = [], 0
+    for prefix in combinations(range(n), size - depth):
+        tail = tails[prefix[-1] + 1 if prefix else 0]
+        if len(tail) == 0:
+            continue
+        pending.append(np.uint64(subset_to_mask(prefix)) | tail)
+        count += len(tail)
+        if count >= block_size:
+            yield np.concatenate(pending)
+            pending, count = [], 0
+    if pending:
+        yield np.concatenate(pending)
+
+
+def batched_smallest_vertex_cover(G, block_size=BLOCK_SIZE):
+    """
+    Returns the first smallest vertex cover of G in combinations() order, the same
+    tuple the serial exhaustive search finds.
+    """
+    vertices = list(G.nodes())
+    n = len(vertices)
+    if n > 64:
+        raise ValueError("Batched search packs subsets into uint64, at most 64 vertices.")
+    eu, ev = edge_arrays(G, vertices)
+
+    for size in range(n + 1):
+        for masks in combination_masks(n, size, block_size):
+            ok = is_vertex_cover_batch(masks, eu, ev)
+            if ok.any():
+                mask = int(masks[int(np.argmax(ok))])
+                return tuple(vertices[i] for i in range(n) if (mask >> i) & 1)
+    return ()
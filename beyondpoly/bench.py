@@ -0,0 +1,202 @@
+"""
+Scaling benchmark suite for the vertex cover and k-center algorithms.
+
+Vertex cover algorithms run on generated G(n, m) graphs over a grid of n and
+edge density. The k-center algorithms run on generated Gaussian blob datasets
+over a grid of sample counts. Every point gets warmup runs and then timed
+repeats with perf_counter. It also gets one extra tracemalloc run for peak
+memory. Results are written as JSON and CSV, plus log-log time plots.
+
+Algorithms whose script cannot be imported (missing pulp or scikit-learn) are
+skipped with a note. Each algorithm has a size cap, so brute force stops before
+it falls off its exponential cliff.
+
+Usage:
+    python -m beyondpoly.bench --quick
+    python -m beyondpoly.bench --ns 16 20 24 200 2000 --densities 0.05 0.2 --repeats 7
+"""
+
+import argparse
+import contextlib
+import csv
+import importlib.util
+import io
+import json
+import os
+import time
+import tracemalloc
+
+import numpy as np
+
+from beyondpoly import ROOT
+from beyondpoly.bitmask import smallest_vertex_cover
+from beyondpoly.fpt import min_vertex_cover
+from beyondpoly.generators import gnm_edges, pair_count
+from beyondpoly.graph import CompactGraph
+from beyondpoly.matching import greedy_vertex_cover
+
+
+def load_script(name, relative_path):
+    # imports one of the assignment scripts as a module, None if its dependencies are missing
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError as e:
+        print(f"skipping {relative_path}: {e}")
+        return None
+    return module
+
+
+def vertex_cover_algorithms():
+    # name -> (solver(G) returning a cover, largest n to try)
+    algorithms = {
+        "bruteforce": (smallest_vertex_cover, 22),
+        "fpt": (min_vertex_cover, 60),
+        "greedy_matching": (lambda G: greedy_vertex_cover(G)[0], None),
+    }
+    lp = load_script("LProunding", os.path.join("assignment4", "LProunding.py"))
+    if lp is not None:
+        algorithms["lp_rounding"] = (lambda G: lp.greedy_vertex_cover(G)[0], 5000)
+    return algorithms
+
+
+def k_center_algorithms():
+    # name -> (solver(X, k) returning center indices, largest n to try)
+    a5 = load_script("assignment5", os.path.join("Assignment 5", "assignment5.py"))
+    if a5 is None:
+        return {}, None
+    return {
+        "gonzalez_k_centers": (lambda X, k: a5.gonzalez_k_centers(X, k, rng_seed=0), None),
+        "hochbaum_shmoys": (lambda X, k: a5.hochbaum_shmoys(X, k)[0], 1500),
+    }, a5.k_center_cost
+
+
+def blob_dataset(n, dims=2, centers=8, seed=0):
+    rng = np.random.default_rng(seed)
+    means = rng.uniform(-10, 10, size=(centers, dims))
+    return means[rng.integers(0, centers, n)] + rng.normal(size=(n, dims))
+
+
+def measure(fn, warmup, repeats):
+    """
+    Times fn() and returns (result, timings dict). Output printed by fn is swallowed.
+    """
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for _ in range(warmup):
+            fn()
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    p10, median, p90 = np.percentile(times, [10, 50, 90])
+    return result, {"median_s": median, "p10_s": p10, "p90_s": p90, "min_s": min(times),
+                    "repeats": repeats, "peak_bytes": peak}
+
+
+def run_vertex_cover_sweep(ns, densities, warmup, repeats, only=None, seed=0):
+    rows = []
+    algorithms = vertex_cover_algorithms()
+    for n in ns:
+        for density in densities:
+            m = int(round(density * pair_count(n)))
+            u, v = gnm_edges(n, m, seed)
+            C = CompactGraph.from_edge_arrays(u, v, nodes=np.arange(n))
+            G = C.to_networkx()
+            for name, (solver, max_n) in algorithms.items():
+                if (only and name not in only) or (max_n is not None and n > max_n):
+                    continue
+                cover, timing = measure(lambda: solver(G), warmup, repeats)
+                rows.append({"kind": "vertex_cover", "algorithm": name, "n": n, "m": m,
+                             "density": density, "k": "", "quality": len(cover), **timing})
+                print(f"{name:<18} n={n:<7} m={m:<9} median {timing['median_s']:.4g}s")
+    return rows
+
+
+def run_k_center_sweep(ns, ks, warmup, repeats, only=None, seed=0):
+    rows = []
+    algorithms, cost = k_center_algorithms()
+    for n in ns:
+        X = blob_dataset(n, seed=seed)
+        for k in ks:
+            for name, (solver, max_n) in algorithms.items():
+                if (only and name not in only) or (max_n is not None and n > max_n):
+                    continue
+                centers, timing = measure(lambda: solver(X, k), warmup, repeats)
+                rows.append({"kind": "k_center", "algorithm": name, "n": n, "m": "",
+                             "density": "", "k": k, "quality": cost(X, centers), **timing})
+                print(f"{name:<18} n={n:<7} k={k:<4} median {timing['median_s']:.4g}s")
+    return rows
+
+
+def write_results(rows, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "bench_results.json"), 'w') as out:
+        json.dump(rows, out, indent=2, default=float)
+    if rows:
+        with open(os.path.join(output_dir, "bench_results.csv"), 'w', newline='') as out:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def plot_scaling(rows, output_dir):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    for kind, size_of, xlabel in (("vertex_cover", lambda r: r["n"] + r["m"], "n + m"),
+                                  ("k_center", lambda r: r["n"], "n samples")):
+        kind_rows = [r for r in rows if r["kind"] == kind]
+        if not kind_rows:
+            continue
+        plt.figure(figsize=(8, 5))
+        series = {}
+        for r in kind_rows:
+            label = r["algorithm"] + (f" d={r['density']}" if kind == "vertex_cover" else f" k={r['k']}")
+            series.setdefault(label, []).append((size_of(r), r["median_s"]))
+        for label, points in sorted(series.items()):
+            points.sort()
+            plt.loglog(*zip(*points), marker='o', label=label)
+        plt.xlabel(xlabel)
+        plt.ylabel("median time (seconds)")
+        plt.title(f"{kind.replace('_', ' ')} scaling")
+        plt.legend(fontsize="small")
+        plt.tight_layout()
+        plt.savefig(os.path.join(output_dir, f"scaling_{kind}.png"))
+        plt.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for vertex cover and k-center.")
+    parser.add_argument("--ns", type=int, nargs="+", default=[12, 16, 20, 50, 200, 1000, 5000])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.05, 0.2])
+    parser.add_argument("--kc-ns", type=int, nargs="+", default=[200, 500, 1000, 5000])
+    parser.add_argument("--ks", type=int, nargs="+", default=[5, 10])
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--algorithms", nargs="+", help="only run these algorithms")
+    parser.add_argument("--quick", action="store_true", help="small grid for a smoke run")
+    parser.add_argument("--output-dir", default="bench_output")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.ns, args.kc_ns, args.ks, args.repeats = [12, 16, 100], [200, 500], [5], 3
+
+    rows = run_vertex_cover_sweep(args.ns, args.densities, args.warmup, args.repeats, args.algorithms)
+    rows += run_k_center_sweep(args.kc_ns, args.ks, args.warmup, args.repeats, args.algorithms)
+    write_results(rows, args.output_dir)
+    plot_scaling(rows, args.output_dir)
+    print(f"Wrote {len(rows)} rows to {args.output_dir}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Binary edge-list format for graphs too large for the text inputs.
+
+Layout (all little-endian):
+
+    offset  size  field
+    0       8     magic b"VCEDGES\\0"
+    8       4     format version (uint32, currently 1)
+    12      4     bytes per vertex id (uint32, 4 for int32 or 8 for int64)
+    16      8     n, number of vertices (uint64)
+    24      8     m, number of edges (uint64)
+    32      ...   m rows of (u, v) vertex ids, int32 or int64
+
+The edge block is a plain C-ordered (m, 2) array, so it can be opened with
+numpy.memmap and streamed chunk by chunk without loading it.
+"""
+
+from itertools import islice
+
+import numpy as np
+
+
+MAGIC = b"VCEDGES\0"
+VERSION = 1
+HEADER = np.dtype([("magic", "S8"), ("version", "<u4"), ("id_bytes", "<u4"),
+                   ("n", "<u8"), ("m", "<u8")])
+CHUNK_EDGES = 1 << 20
+
+
+def _id_dtype(id_bytes):
+    if id_bytes == 4:
+        return np.dtype("<i4")
+    if id_bytes == 8:
+        return np.dtype("<i8")
+    raise ValueError(f"Unsupported vertex id width: {id_bytes} bytes.")
+
+
+def is_binary_graph(filename):
+    with open(filename, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def read_binary_header(filename):
+    # (n, m, id dtype) of a binary graph file
+    header = np.fromfile(filename, dtype=HEADER, count=1)
+    if len(header) == 0 or header["magic"][0] != MAGIC.rstrip(b"\0"):
+        raise ValueError(f"{filename}: not a binary graph file.")
+    if header["version"][0] != VERSION:
+        raise ValueError(f"{filename}: unsupported format version {header['version'][0]}.")
+    return int(header["n"][0]), int(header["m"][0]), _id_dtype(int(header["id_bytes"][0]))
+
+
+def open_binary_edges(filename):
+    """
+    Memory-maps the edge block of a binary graph file.
+
+    Returns:
+        (n, m, edges): edges is a read-only (m, 2) numpy.memmap.
+    """
+    n, m, dtype = read_binary_header(filename)
+    if m == 0:
+        return n, m, np.zeros((0, 2), dtype=dtype)
+    edges = np.memmap(filename, dtype=dtype, mode='r', offset=HEADER.itemsize, shape=(m, 2))
+    return n, m, edges
+
+
+def iter_binary_edge_chunks(filename, chunk_edges=CHUNK_EDGES):
+    # (u, v) array pairs of at most chunk_edges edges each
+    n, m, edges = open_binary_edges(filename)
+    for start in range(0, m, chunk_edges):
+        block = np.asarray(edges[start:start + chunk_edges])
+        yield block[:, 0], block[:, 1]
+
+
+class BinaryGraphWriter:
+    """
+    Streams edge chunks into a binary graph file; m is patched into the header on close.
+
+    Args:
+        filename (str): Output filename.
+        n (int): Number of vertices.
+        id_bytes (int): 4 or 8; defaults to 4 when n fits in int32.
+    """
+
+    def __init__(self, filename, n, id_bytes=None):
+        if id_bytes is None:
+            id_bytes = 4 if n <= np.iinfo(np.int32).max + 1 else 8
+        self.n = n
+        self.m = 0
+        self.id_bytes = id_bytes
+        self.dtype = _id_dtype(id_bytes)
+        self.file = open(filename, 'wb')
+        self._write_header()
+
+    def _write_header(self):
+        header = np.array([(MAGIC, VERSION, self.id_bytes, self.n, self.m)], dtype=HEADER)
+        self.file.seek(0)
+        self.file.write(header.tobytes())
+
+    def write(self, u, v):
+        block = np.empty((len(u), 2), dtype=self.dtype)
+        block[:, 0] = u
+        block[:, 1] = v
+        self.file.write(block.tobytes())
+        self.m += len(block)
+
+    def close(self):
+        self._write_header()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_binary_graph(filename, n, u, v, id_bytes=None):
+    with BinaryGraphWriter(filename, n, id_bytes) as writer:
+        writer.write(u, v)
+
+
+def iter_text_stream_chunks(file, chunk_edges=CHUNK_EDGES):
+    """
+    Streams the edges of an already open binary-mode text stream (a file or
+    sys.stdin.buffer) as (u, v) array chunks.
+
+    Yields the `n m` header values first as a tuple, then the chunks.
+    """
+    n, m = map(int, file.readline().split())
+    yield n, m
+    while True:
+        lines = list(islice(file, chunk_edges))
+        if not lines:
+            return
+        values = np.fromstring(b" ".join(lines), dtype=np.int64, sep=" ").reshape(-1, 2)
+        yield values[:, 0], values[:, 1]
+
+
+def iter_text_edge_chunks(filename, chunk_edges=CHUNK_EDGES):
+    # same as iter_text_stream_chunks for a text input file
+    with open(filename, 'rb') as file:
+        yield from iter_text_stream_chunks(file, chunk_edges)
+
+
+def text_to_binary(text_filename, binary_filename, chunk_edges=CHUNK_EDGES, id_bytes=None):
+    chunks = iter_text_edge_chunks(text_filename, chunk_edges)
+    n, m = next(chunks)
+    with BinaryGraphWriter(binary_filename, n, id_bytes) as writer:
+        for u, v in chunks:
+            writer.write(u, v)
+    if writer.m != m:
+        raise ValueError(f"{text_filename}: header says {m} edges but found {writer.m}.")
+
+
+def binary_to_text(binary_filename, text_filename, chunk_edges=CHUNK_EDGES):
+    n, m, _ = read_binary_header(binary_filename)
+    with open(text_filename, 'w') as file:
+        file.write(f"{n} {m}\n")
+        for u, v in iter_binary_edge_chunks(binary_filename, chunk_edges):
+            np.savetxt(file, np.column_stack((u, v)), fmt="%d")
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m beyondpoly.binformat input.txt output.bin  (or .bin -> .txt)
+    source, target = sys.argv[1], sys.argv[2]
+    if is_binary_graph(source):
+        binary_to_text(source, target)
+    else:
+        text_to_binary(source, target)
+    print(f"Converted '{source}' to '{target}'.")
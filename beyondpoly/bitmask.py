@@ -0,0 +1,127 @@
+"""
+Integer bitmask helpers for exact vertex cover search.
+
+Bit i of every mask stands for vertices[i] of the list the masks were built from.
+
+first_cover walks the subsets of one size in combinations() order as a depth
+first search. Every vertex passed over is out of the cover, so all of its
+neighbours have to be picked; a branch is cut as soon as a left-out vertex is
+itself needed, or more vertices are needed than picks remain. Cut branches
+hold no cover, so the first cover found is the same one the plain scan over
+combinations() would return, after visiting a small fraction of the subsets.
+The search keeps its levels on an explicit stack, since its depth is the cover
+size.
+"""
+
+
+from beyondpoly.graph import CompactGraph
+
+
+def build_neighbour_masks(G, vertices):
+    if isinstance(G, CompactGraph) and vertices == G.nodes():
+        eu, ev = G.eu.tolist(), G.ev.tolist()
+        masks = [0] * len(vertices)
+        for u, v in zip(eu, ev):
+            masks[u] |= 1 << v
+            masks[v] |= 1 << u
+        return masks
+    index = {v: i for i, v in enumerate(vertices)}
+    masks = [0] * len(vertices)
+    for u, v in G.edges():
+        masks[index[u]] |= 1 << index[v]
+        masks[index[v]] |= 1 << index[u]
+    return masks
+
+
+def subset_to_mask(subset):
+    mask = 0
+    for i in subset:
+        mask |= 1 << i
+    return mask
+
+
+def is_vertex_cover_mask(neighbour_masks, subset_mask):
+    # a vertex left out of the subset needs all of its neighbours inside it;
+    # only the left-out vertices are visited, lowest bit first
+    left_out = ((1 << len(neighbour_masks)) - 1) & ~subset_mask
+    while left_out:
+        low = left_out & -left_out
+        if neighbour_masks[low.bit_length() - 1] & ~subset_mask:
+            return False
+        left_out ^= low
+    return True
+
+
+def suffix_unions(masks):
+    # suffix[i] is the union of the neighbour masks of vertices i..n-1
+    suffix = [0] * (len(masks) + 1)
+    for i in range(len(masks) - 1, -1, -1):
+        suffix[i] = suffix[i + 1] | masks[i]
+    return suffix
+
+
+def first_cover(masks, size, start=0, chosen=0, need=0, suffix=None):
+    """
+    First vertex cover with exactly `size` vertices, in combinations() order.
+
+    Vertices below start are already decided: the ones in the chosen mask are
+    in the cover, the others are out and need is the union of their
+    neighbour masks.
+
+    Returns:
+        tuple: Indices of the chosen vertices, or None when no cover of that
+        size extends the decided part.
+    """
+    n = len(masks)
+    suffix = suffix or suffix_unions(masks)
+    picked = [i for i in range(start) if (chosen >> i) & 1]
+    # one [next candidate, need, len(picked)] frame per open level; the depth
+    # is the cover size, too deep for recursion on large kernel cores
+    frames = []
+    while True:
+        left = size - len(picked)
+        if bin(need & ~chosen).count("1") <= left:
+            if left == 0:
+                # everything from start on is left out as well
+                if not (need | suffix[start]) & ~chosen:
+                    return tuple(picked)
+            else:
+                frames.append([start, need, len(picked)])
+
+        # next candidate of the deepest open level, closing exhausted levels
+        while frames:
+            frame = frames[-1]
+            j, need, base = frame
+            if len(picked) > base:
+                # back from picking j: from here on j is left out, so its
+                # neighbours must be picked
+                picked.pop()
+                chosen ^= 1 << j
+                need |= masks[j]
+                if need & ~chosen & ((2 << j) - 1):
+                    frames.pop()  # a vertex that is already left out is needed
+                    continue
+                j += 1
+            if j > n - (size - base):
+                frames.pop()
+                continue
+            frame[0], frame[1] = j, need
+            picked.append(j)
+            chosen |= 1 << j
+            start = j + 1
+            break
+        else:
+            return None
+
+
+def smallest_vertex_cover(G, min_size=0):
+    # serial exhaustive search, first cover in combinations() order; sizes
+    # below min_size (a known lower bound) are skipped
+    vertices = list(G.nodes())
+    masks = build_neighbour_masks(G, vertices)
+    suffix = suffix_unions(masks)
+    for r in range(min_size, len(vertices) + 1):
+        subset = first_cover(masks, r, suffix=suffix)
+        if subset is not None:
+            return tuple(vertices[i] for i in subset)
+    return ()
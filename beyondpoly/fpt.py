@@ -0,0 +1,180 @@
+"""
+Exact vertex cover by kernelization plus a bounded search tree (FPT mode).
+
+Reductions applied at every node of the search tree:
+    - degree 0: the vertex is dropped
+    - degree 1: its neighbour goes into the cover
+    - degree 2: both neighbours go in if they are adjacent, otherwise the
+      three vertices are folded into one new vertex (cover size drops by 1)
+    - Buss: with budget k, a vertex of degree > k must be in the cover
+
+The search branches on a maximum degree vertex v (take v, or take N(v)) and
+prunes with a greedy matching lower bound and the Buss k^2 edge bound.
+"""
+
+import itertools
+
+
+_fold_ids = itertools.count()
+
+
+def adjacency_from_graph(G):
+    return {v: set(G.neighbors(v)) for v in G.nodes()}
+
+
+def _remove(adj, v):
+    for u in adj.pop(v):
+        adj[u].discard(v)
+
+
+def _edge_count(adj):
+    return sum(len(nbrs) for nbrs in adj.values()) // 2
+
+
+def matching_lower_bound(adj):
+    # size of a greedy maximal matching; every matched edge needs its own cover vertex
+    matched = set()
+    size = 0
+    for u, nbrs in adj.items():
+        if u in matched:
+            continue
+        for v in nbrs:
+            if v not in matched:
+                matched.add(u)
+                matched.add(v)
+                size += 1
+                break
+    return size
+
+
+def greedy_upper_bound(adj):
+    # repeatedly take a max degree vertex; gives a starting budget for the search
+    adj = {v: set(nbrs) for v, nbrs in adj.items()}
+    cover = set()
+    while True:
+        v = max(adj, key=lambda x: len(adj[x]), default=None)
+        if v is None or not adj[v]:
+            return cover
+        cover.add(v)
+        _remove(adj, v)
+
+
+def reduce_graph(adj, k, fold=True):
+    """
+    Applies the reduction rules to adj in place until none fires.
+
+    With k = math.inf the Buss rule never fires, and with fold=False a degree-2
+    vertex with non-adjacent neighbours is left alone, so every vertex left in
+    adj is an original one.
+
+    Returns (forced, folds, k) where forced are vertices that must be in the
+    cover, folds records the degree-2 folds to undo, and k is the remaining
+    budget (negative when no cover of the original budget exists).
+    """
+    forced = set()
+    folds = []
+    changed = True
+    while changed and k >= 0:
+        changed = False
+        for v in list(adj):
+            if v not in adj:
+                continue
+            nbrs = adj[v]
+            if len(nbrs) == 0:
+                del adj[v]
+            elif len(nbrs) == 1:
+                u = next(iter(nbrs))
+                forced.add(u)
+                _remove(adj, u)
+                del adj[v]
+                k -= 1
+            elif len(nbrs) == 2:
+                a, b = nbrs
+                if b in adj[a]:
+                    forced.update((a, b))
+                    _remove(adj, a)
+                    _remove(adj, b)
+                    del adj[v]
+                    k -= 2
+                elif fold:
+                    w = ("fold", next(_fold_ids))
+                    merged = (adj[a] | adj[b]) - {v}
+                    _remove(adj, v)
+                    _remove(adj, a)
+                    _remove(adj, b)
+                    adj[w] = merged
+                    for u in merged:
+                        adj[u].add(w)
+                    folds.append((w, v, a, b))
+                    k -= 1
+                else:
+                    continue
+            elif len(nbrs) > k:
+                forced.add(v)
+                _remove(adj, v)
+                k -= 1
+            else:
+                continue
+            changed = True
+            if k < 0:
+                break
+    return forced, folds, k
+
+
+def unfold(cover, folds):
+    # undo folds newest first; a folded vertex in the cover stands for both outer vertices
+    cover = set(cover)
+    for w, v, a, b in reversed(folds):
+        if w in cover:
+            cover.discard(w)
+            cover.update((a, b))
+        else:
+            cover.add(v)
+    return cover
+
+
+def _search(adj, k):
+    # smallest cover of size <= k, or None when there is none
+    adj = {v: set(nbrs) for v, nbrs in adj.items()}
+    forced, folds, k = reduce_graph(adj, k)
+    if k < 0:
+        return None
+
+    edges = _edge_count(adj)
+    if edges == 0:
+        return unfold(forced, folds)
+    if edges > k * k or matching_lower_bound(adj) > k:
+        return None
+
+    v = max(adj, key=lambda x: len(adj[x]))
+    nbrs = set(adj[v])
+    best = None
+
+    take_v = {u: set(n) for u, n in adj.items()}
+    _remove(take_v, v)
+    sub = _search(take_v, k - 1)
+    if sub is not None:
+        best = sub | {v}
+        k = len(best) - 1  # the other branch only matters if it is strictly smaller
+
+    if len(nbrs) <= k:
+        take_nbrs = {u: set(n) for u, n in adj.items()}
+        for u in nbrs:
+            _remove(take_nbrs, u)
+        sub = _search(take_nbrs, k - len(nbrs))
+        if sub is not None:
+            best = sub | nbrs
+
+    if best is None:
+        return None
+    return unfold(forced | best, folds)
+
+
+def min_vertex_cover(G):
+    """
+    Returns a minimum vertex cover of the networkx graph G as a set.
+    """
+    adj = adjacency_from_graph(G)
+    upper = greedy_upper_bound(adj)
+    cover = _search(adj, len(upper))
+    return upper if cover is None else cover
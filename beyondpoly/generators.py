@@ -0,0 +1,323 @@
+"""
+Vectorized random graph generators.
+
+Edges are sampled without replacement directly in the pair-index space
+0 .. n(n-1)/2 - 1 and decoded to (u, v) with u < v, so there is no rejection
+loop and dense graphs cost the same as sparse ones.
+
+generate_chunked writes graphs too large to hold in memory. The pair-index
+range is cut into chunks, each chunk gets its own SeedSequence child stream,
+and worker processes sample and format the chunks while the parent streams
+them to a text or binary file in order. The same (seed, chunk_edges) gives the
+same file for any number of workers.
+
+Usage:
+    python -m beyondpoly.generators big.bin 20000000 --edges 100000000 --seed 7
+    python -m beyondpoly.generators big.txt 1000000 --p 0.00001 --workers 4
+"""
+
+import argparse
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from beyondpoly.binformat import CHUNK_EDGES, BinaryGraphWriter, is_binary_graph
+
+
+def pair_count(n):
+    return n * (n - 1) // 2
+
+
+def decode_pairs(k, n):
+    """
+    Maps pair indices k (row-major over u < v) back to endpoint arrays (u, v).
+    """
+    k = np.asarray(k, dtype=np.int64)
+    # row u starts at offset u*n - u*(u+1)/2; invert that quadratic in floats,
+    # then step the estimate in exact integers until start(u) <= k < start(u+1).
+    # The float estimate can be off by more than one row once n is ~1e8.
+    b = 2 * n - 1
+    u = np.floor((b - np.sqrt(b * b - 8.0 * k)) / 2).astype(np.int64)
+    np.clip(u, 0, max(n - 2, 0), out=u)
+    while True:
+        over = u * n - u * (u + 1) // 2 > k
+        if not over.any():
+            break
+        u[over] -= 1
+    while True:
+        nxt = u + 1
+        under = nxt * n - nxt * (nxt + 1) // 2 <= k
+        if not under.any():
+            break
+        u[under] += 1
+    start = u * n - u * (u + 1) // 2
+    v = k - start + u + 1
+    return u, v
+
+
+def gnm_edges(n, m, seed=None):
+    """
+    Uniform G(n, m): m distinct edges over vertices 0..n-1 as (u, v) arrays.
+
+    Raises:
+        ValueError: if m exceeds n(n-1)/2.
+    """
+    total = pair_count(n)
+    if m > total:
+        raise ValueError("Too many edges for given number of vertices.")
+    rng = np.random.default_rng(seed)
+    k = rng.choice(total, size=m, replace=False)
+    return decode_pairs(k, n)
+
+
+def gnp_edges(n, p, seed=None):
+    """
+    G(n, p): every pair is an edge independently with probability p.
+
+    The edge count is drawn from Binomial(n(n-1)/2, p) and the edges are then
+    uniform given the count, which is the same distribution.
+    """
+    rng = np.random.default_rng(seed)
+    m = rng.binomial(pair_count(n), p)
+    return decode_pairs(rng.choice(pair_count(n), size=m, replace=False), n)
+
+
+def power_law_weights(n, exponent=2.5, average_degree=4.0):
+    # expected degrees w_i ~ (i+1)^(-1/(exponent-1)), scaled to the requested mean
+    w = np.arange(1, n + 1, dtype=float) ** (-1.0 / (exponent - 1))
+    return w * (average_degree * n / w.sum())
+
+
+def chung_lu_edges(weights, seed=None):
+    """
+    Chung-Lu graph: vertex i gets expected degree about weights[i].
+
+    Both endpoints of sum(w)/2 candidate edges are drawn proportional to w.
+    Self loops and repeated pairs are dropped, which slightly trims the
+    heaviest vertices, as in the usual fast Chung-Lu sampler.
+    """
+    w = np.asarray(weights, dtype=float)
+    n = len(w)
+    rng = np.random.default_rng(seed)
+    m = rng.poisson(w.sum() / 2)
+    cumulative = np.cumsum(w)
+    u = np.searchsorted(cumulative, rng.random(m) * cumulative[-1], side="right")
+    v = np.searchsorted(cumulative, rng.random(m) * cumulative[-1], side="right")
+    keep = u != v
+    a = np.minimum(u[keep], v[keep])
+    b = np.maximum(u[keep], v[keep])
+    keys = np.unique(a * n + b)
+    return keys // n, keys % n
+
+
+def bipartite_edges(n1, n2, m, seed=None):
+    """
+    Uniform bipartite graph with m edges between 0..n1-1 and n1..n1+n2-1.
+
+    Raises:
+        ValueError: if m exceeds n1 * n2.
+    """
+    if m > n1 * n2:
+        raise ValueError("Too many edges for given number of vertices.")
+    k = np.random.default_rng(seed).choice(n1 * n2, size=m, replace=False)
+    return k // n2, n1 + k % n2
+
+
+def planted_cover_edges(n, k, m, seed=None):
+    """
+    Random graph whose minimum vertex cover is a known set of k vertices.
+
+    A hidden set C of k vertices gets a perfect matching into the other side.
+    That matching forces every cover to have at least k vertices. All other
+    edges are sampled among the pairs that touch C, so C itself is a cover and
+    the optimum is exactly k.
+
+    Returns:
+        tuple: (u, v, cover) with cover the planted optimum, sorted.
+
+    Raises:
+        ValueError: if 2k > n, m < k, or m exceeds the pairs touching C.
+    """
+    touching = k * n - k * (k + 1) // 2  # pairs (u, v), u < v, with u among the first k ids
+    if 2 * k > n or m < k or m > touching:
+        raise ValueError("Need 2k <= n and k <= m <= pairs touching the cover.")
+    rng = np.random.default_rng(seed)
+
+    # work with C = ids 0..k-1, matched to k..2k-1, and relabel at the end
+    ids = np.arange(k)
+    matching = ids * n - ids * (ids + 1) // 2 + (k - 1)  # pair index of (i, k + i)
+    extra = rng.choice(touching, size=m, replace=False)
+    extra = extra[~np.isin(extra, matching)][:m - k]
+    u, v = decode_pairs(np.concatenate([matching, extra]), n)
+
+    perm = rng.permutation(n)
+    u, v = perm[u], perm[v]
+    return np.minimum(u, v), np.maximum(u, v), np.sort(perm[:k])
+
+
+def format_edges(u, v):
+    """
+    Formats edges as "u v\\n" lines, returned as one bytes block.
+
+    Digits are produced with array arithmetic into a fixed-width byte table,
+    and the padding is squeezed out afterwards. No per-edge Python formatting.
+    """
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    if len(u) == 0:
+        return b""
+    width = len(str(int(max(u.max(), v.max(), 0))))
+    table = np.zeros((len(u), 2 * width + 2), dtype=np.uint8)
+    for column, values in ((0, u), (width + 1, v)):
+        for j in range(width):
+            power = 10 ** (width - 1 - j)
+            digit = (values // power) % 10 + ord("0")
+            # leading zeros stay 0 and are dropped below; a lone 0 is kept
+            digit[(values < power) & (power > 1)] = 0
+            table[:, column + j] = digit
+    table[:, width] = ord(" ")
+    table[:, -1] = ord("\n")
+    flat = table.ravel()
+    return flat[flat != 0].tobytes()
+
+
+def write_edge_list(filename, n, u, v):
+    # the "n m" header plus all edges in one write
+    with open(filename, 'wb') as f:
+        f.write(f"{n} {len(u)}\n".encode() + format_edges(u, v))
+
+
+# multivariate_hypergeometric only accepts populations below this
+EXACT_SPLIT_LIMIT = 10**9 - 1
+
+
+def _split_edges(rng, ranges, n, m, p):
+    # edges per chunk: exact hypergeometric (G(n, m)) or binomial (G(n, p)) counts
+    if p is not None:
+        return rng.binomial(ranges, p)
+    total = pair_count(n)
+    if total <= EXACT_SPLIT_LIMIT:
+        return rng.multivariate_hypergeometric(ranges, m, method="marginals")
+    # huge pair spaces: multinomial split, indistinguishable from the
+    # hypergeometric one while m is a vanishing fraction of all pairs
+    counts = rng.multinomial(m, ranges / total)
+    if (counts > ranges).any():
+        raise ValueError("Graph too dense for chunked generation, use gnm_edges.")
+    return counts
+
+
+def chunk_plan(n, m=None, p=None, seed=0, chunk_edges=CHUNK_EDGES):
+    """
+    Splits the pair-index range of a G(n, m) or G(n, p) graph into chunks.
+
+    Returns:
+        list: (start, stop, count, SeedSequence) per chunk; the chunk samples
+        count distinct pair indices from start..stop-1 with its own stream.
+
+    Raises:
+        ValueError: unless exactly one of m and p is given, or if m exceeds n(n-1)/2.
+    """
+    if (m is None) == (p is None):
+        raise ValueError("Give either m or p.")
+    total = pair_count(n)
+    if m is not None and m > total:
+        raise ValueError("Too many edges for given number of vertices.")
+    expected = m if m is not None else p * total
+    chunks = max(1, min(total, math.ceil(expected / chunk_edges)))
+    bounds = np.array([total * i // chunks for i in range(chunks + 1)], dtype=np.int64)
+
+    plan_seed, *chunk_seeds = np.random.SeedSequence(seed).spawn(chunks + 1)
+    counts = _split_edges(np.random.default_rng(plan_seed), np.diff(bounds), n, m, p)
+    return [(int(bounds[i]), int(bounds[i + 1]), int(counts[i]), chunk_seeds[i]) for i in range(chunks)]
+
+
+def _generate_chunk(n, start, stop, count, seed_seq, text, id_dtype):
+    # runs in a worker; returns formatted bytes or narrow (u, v) arrays
+    rng = np.random.default_rng(seed_seq)
+    u, v = decode_pairs(start + rng.choice(stop - start, size=count, replace=False), n)
+    if text:
+        return format_edges(u, v)
+    return u.astype(id_dtype), v.astype(id_dtype)
+
+
+def _ordered_results(pool, plan, n, text, id_dtype, in_flight):
+    # keeps at most in_flight chunks alive and yields them in plan order
+    pending = deque()
+    for start, stop, count, seed_seq in plan:
+        if pool is None:
+            yield _generate_chunk(n, start, stop, count, seed_seq, text, id_dtype)
+            continue
+        pending.append(pool.submit(_generate_chunk, n, start, stop, count, seed_seq, text, id_dtype))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def generate_chunked(filename, n, m=None, p=None, seed=0, workers=None, chunk_edges=CHUNK_EDGES,
+                     binary=None):
+    """
+    Writes a seeded G(n, m) or G(n, p) graph chunk by chunk.
+
+    Memory is bounded by about two chunks per worker, whatever the graph size.
+
+    Args:
+        filename (str): Output filename.
+        n (int): Number of vertices.
+        m (int): Exact number of edges (uniform G(n, m)), or
+        p (float): Edge probability (G(n, p)).
+        seed (int): Root seed; the file depends only on seed and chunk_edges.
+        workers (int): Worker processes, default os.cpu_count(); 1 runs inline.
+        chunk_edges (int): Target edges per chunk.
+        binary (bool): Binary edge-list format; defaults to a .bin extension.
+
+    Returns:
+        int: Number of edges written.
+    """
+    plan = chunk_plan(n, m, p, seed, chunk_edges)
+    m = sum(count for _, _, count, _ in plan)
+    if binary is None:
+        binary = filename.endswith(".bin")
+    workers = workers or os.cpu_count() or 1
+    id_dtype = np.int32 if n <= np.iinfo(np.int32).max + 1 else np.int64
+
+    pool = ProcessPoolExecutor(workers) if workers > 1 and len(plan) > 1 else None
+    try:
+        results = _ordered_results(pool, plan, n, not binary, id_dtype, 2 * workers)
+        if binary:
+            with BinaryGraphWriter(filename, n) as writer:
+                for u, v in results:
+                    writer.write(u, v)
+        else:
+            with open(filename, 'wb') as f:
+                f.write(f"{n} {m}\n".encode())
+                for block in results:
+                    f.write(block)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return m
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded random graph in chunks.")
+    parser.add_argument("filename", help="output file; .bin selects the binary format")
+    parser.add_argument("n", type=int, help="number of vertices")
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument("--edges", type=int, help="exact number of edges, G(n, m)")
+    size.add_argument("--p", type=float, help="edge probability, G(n, p)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-edges", type=int, default=CHUNK_EDGES)
+    args = parser.parse_args()
+
+    m = generate_chunked(args.filename, args.n, args.edges, args.p, args.seed, args.workers, args.chunk_edges)
+    kind = "binary" if is_binary_graph(args.filename) else "text"
+    print(f"Generated {kind} graph '{args.filename}' with {args.n} vertices and {m} edges.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Compact array-backed graph for the solver hot paths.
+
+Vertices are relabelled to contiguous int32 ids 0..n-1 and the adjacency is
+stored in CSR form (indptr/indices) next to the edge endpoint arrays, so a
+million-edge graph takes a few tens of MB instead of networkx's dict-of-dicts.
+
+CompactGraph answers the handful of networkx calls the solvers make (nodes(),
+edges(), neighbors(), number_of_nodes(), number_of_edges()) with the original
+vertex labels, so it can be passed anywhere an nx.Graph was. Convert with
+to_networkx() only when plotting.
+"""
+
+import hashlib
+
+import networkx as nx
+import numpy as np
+
+
+class CompactGraph:
+    __slots__ = ("labels", "indptr", "indices", "eu", "ev", "_index")
+
+    def __init__(self, labels, eu, ev):
+        # eu/ev are ids into labels with u != v and every edge stored once
+        n = len(labels)
+        self.labels = labels
+        self.eu = np.asarray(eu, dtype=np.int32)
+        self.ev = np.asarray(ev, dtype=np.int32)
+
+        src = np.concatenate((self.eu, self.ev))
+        dst = np.concatenate((self.ev, self.eu))
+        order = np.argsort(src, kind="stable")
+        self.indices = dst[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self._index = None
+
+    @classmethod
+    def from_edge_arrays(cls, u, v, nodes=None):
+        """
+        Builds a graph from endpoint arrays, dropping self loops and duplicate edges.
+
+        Args:
+            u, v (array-like): Edge endpoints as integer vertex labels.
+            nodes (array-like): Extra vertex labels to keep even if isolated.
+
+        Vertex ids follow the sorted order of the labels.
+        """
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        keep = u != v
+        a = np.minimum(u[keep], v[keep])
+        b = np.maximum(u[keep], v[keep])
+
+        everything = [a, b] if nodes is None else [a, b, np.asarray(nodes, dtype=np.int64)]
+        labels, ids = np.unique(np.concatenate(everything), return_inverse=True)
+        n = len(labels)
+        ia = ids[:len(a)]
+        ib = ids[len(a):2 * len(a)]
+
+        keys = np.unique(ia * n + ib)
+        return cls(labels, keys // n, keys % n)
+
+    @classmethod
+    def from_networkx(cls, G):
+        # keeps G's node order, so the exact solvers break ties the same way
+        nodes = list(G.nodes())
+        index = {v: i for i, v in enumerate(nodes)}
+        m = G.number_of_edges()
+        eu = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.int32, count=m)
+        ev = np.fromiter((index[v] for _, v in G.edges()), dtype=np.int32, count=m)
+        try:
+            labels = np.array(nodes, dtype=np.int64)
+        except (TypeError, ValueError):
+            labels = np.array(nodes, dtype=object)
+        return cls(labels, eu, ev)
+
+    def to_networkx(self):
+        G = nx.Graph()
+        G.add_nodes_from(self.labels.tolist())
+        G.add_edges_from(self.edges())
+        return G
+
+    def number_of_nodes(self):
+        return len(self.labels)
+
+    def number_of_edges(self):
+        return len(self.eu)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def degrees(self):
+        return np.diff(self.indptr)
+
+    def nodes(self):
+        return self.labels.tolist()
+
+    def edges(self):
+        return zip(self.labels[self.eu].tolist(), self.labels[self.ev].tolist())
+
+    def neighbor_ids(self, i):
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def component_ids(self):
+        # min-label propagation with pointer jumping; every vertex ends up with
+        # the smallest id of its connected component
+        comp = np.arange(len(self.labels))
+        while True:
+            low = np.minimum(comp[self.eu], comp[self.ev])
+            new = comp.copy()
+            np.minimum.at(new, self.eu, low)
+            np.minimum.at(new, self.ev, low)
+            new = new[new]
+            if np.array_equal(new, comp):
+                return comp
+            comp = new
+
+    def subgraph(self, ids):
+        # induced subgraph on the given vertex ids, relabelled 0..len(ids)-1
+        ids = np.asarray(ids)
+        mapping = np.full(len(self.labels), -1, dtype=np.int64)
+        mapping[ids] = np.arange(len(ids))
+        keep = (mapping[self.eu] >= 0) & (mapping[self.ev] >= 0)
+        return CompactGraph(self.labels[ids], mapping[self.eu[keep]], mapping[self.ev[keep]])
+
+    def neighbors(self, v):
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels.tolist())}
+        return iter(self.labels[self.neighbor_ids(self._index[v])].tolist())
+
+
+def as_networkx(G):
+    # plotting and networkx algorithms still need the real thing
+    return G.to_networkx() if isinstance(G, CompactGraph) else G
+
+
+def as_compact(G):
+    # the array-backed form the vectorized code works on; G itself when it already is one
+    return G if isinstance(G, CompactGraph) else CompactGraph.from_networkx(G)
+
+
+def graph_key(G):
+    # content hash of an integer-labelled graph, independent of node and edge order;
+    # None when the labels are not integers
+    C = as_compact(G)
+    if C.labels.dtype == object:
+        return None
+    C = CompactGraph.from_edge_arrays(C.labels[C.eu], C.labels[C.ev], nodes=C.labels)
+    digest = hashlib.sha1()
+    for array in (C.labels, C.eu, C.ev):
+        digest.update(np.ascontiguousarray(array, dtype=np.int64).tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,107 @@
+"""
+Shared loader for the `n m` + edge-lines input files.
+
+The edge list is parsed in bulk with NumPy and the parsed arrays are kept in a
+sidecar `<input>.cache.npz` next to the input. The cache records the file's
+mtime and size and is rebuilt whenever either changes, so repeat loads of the
+same inputN.txt skip parsing entirely. Files in the binary edge format of
+beyondpoly/binformat.py are memory-mapped instead and never cached.
+"""
+
+import os
+
+import networkx as nx
+import numpy as np
+
+from beyondpoly.binformat import is_binary_graph, open_binary_edges, read_binary_header
+from beyondpoly.graph import CompactGraph
+
+
+CACHE_SUFFIX = ".cache.npz"
+
+
+def _stamp(filename):
+    st = os.stat(filename)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+
+def read_graph_size(filename):
+    # (n, m) from the header alone, for labelling results without loading the graph
+    if is_binary_graph(filename):
+        n, m, _ = read_binary_header(filename)
+        return n, m
+    with open(filename, 'rb') as file:
+        n, m = map(int, file.readline().split())
+    return n, m
+
+
+def parse_edge_list(filename):
+    """
+    Parses an input file into (n, m, u, v) without building a graph.
+
+    Raises:
+        ValueError: if the header does not match the number of edge rows.
+    """
+    with open(filename, 'rb') as file:
+        header = file.readline().split()
+        body = file.read()
+    if len(header) != 2:
+        raise ValueError(f"{filename}: expected an 'n m' header line.")
+    n, m = map(int, header)
+
+    values = np.fromstring(body, dtype=np.int64, sep=" ") if body.strip() else np.zeros(0, dtype=np.int64)
+    if len(values) % 2:
+        raise ValueError(f"{filename}: odd number of edge endpoints.")
+    edges = values.reshape(-1, 2)
+    if len(edges) != m:
+        raise ValueError(f"{filename}: header says {m} edges but found {len(edges)}.")
+    return n, m, edges[:, 0].copy(), edges[:, 1].copy()
+
+
+def load_edge_list(filename, use_cache=True):
+    # (n, m, u, v), served from the sidecar cache when it is still fresh
+    if is_binary_graph(filename):
+        n, m, edges = open_binary_edges(filename)
+        return n, m, edges[:, 0], edges[:, 1]
+
+    cache = filename + CACHE_SUFFIX
+    stamp = _stamp(filename)
+    if use_cache and os.path.exists(cache):
+        try:
+            with np.load(cache) as data:
+                if np.array_equal(data["stamp"], stamp):
+                    n, m = data["header"].tolist()
+                    return n, m, data["u"], data["v"]
+        except (OSError, KeyError, ValueError):
+            pass  # unreadable cache, parse again
+
+    n, m, u, v = parse_edge_list(filename)
+    if use_cache:
+        tmp = cache + ".tmp.npz"
+        try:
+            np.savez(tmp, stamp=stamp, header=np.array([n, m]), u=u, v=v)
+            os.replace(tmp, cache)
+        except OSError:
+            pass  # read-only input folder, just skip caching
+    return n, m, u, v
+
+
+def read_graph(filename, use_cache=True):
+    G = nx.Graph()
+    try:
+        n, m, u, v = load_edge_list(filename, use_cache)
+    except IOError:
+        print(f"Error opening file: {filename}")
+        return None
+    G.add_edges_from(zip(u.tolist(), v.tolist()))
+    return G
+
+
+def read_compact_graph(filename, use_cache=True):
+    # same as read_graph but returns a CompactGraph; vertex ids follow sorted labels
+    try:
+        n, m, u, v = load_edge_list(filename, use_cache)
+    except IOError:
+        print(f"Error opening file: {filename}")
+        return None
+    return CompactGraph.from_edge_arrays(u, v)
@@ -0,0 +1,80 @@
+"""
+Per-phase timing and memory instrumentation.
+
+The scripts open one run per input graph with new_run() and wrap each step in
+`with phase("parse"):` etc. The phase names used are parse, model_build, solve,
+rounding, verify, write and plot; Final_Comparsion_File splits solve into
+exact_solve and greedy_solve. A phase entered twice in one run accumulates.
+current_run().as_row() gives the `<phase>_s` columns the output writers append.
+
+Optional extras, switched on by environment variables:
+    VC_TRACE_MEMORY=1     tracemalloc peak above the phase's starting
+                          allocation, as `<phase>_peak_bytes`
+    VC_PROFILE=<file>     cProfile over all phases, dumped by dump_profile()
+"""
+
+import cProfile
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+TRACE_MEMORY = os.environ.get("VC_TRACE_MEMORY", "0") == "1"
+PROFILE_FILE = os.environ.get("VC_PROFILE")
+
+_profiler = cProfile.Profile() if PROFILE_FILE else None
+
+
+class PhaseRun:
+    def __init__(self):
+        self.seconds = {}
+        self.peaks = {}
+
+    def as_row(self):
+        row = {f"{name}_s": secs for name, secs in self.seconds.items()}
+        row.update({f"{name}_peak_bytes": peak for name, peak in self.peaks.items()})
+        return row
+
+
+_current = PhaseRun()
+
+
+def new_run():
+    global _current
+    _current = PhaseRun()
+    return _current
+
+
+def current_run():
+    return _current
+
+
+@contextmanager
+def phase(name):
+    run = _current
+    if TRACE_MEMORY:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    if _profiler is not None:
+        _profiler.enable()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if _profiler is not None:
+            _profiler.disable()
+        run.seconds[name] = run.seconds.get(name, 0.0) + elapsed
+        if TRACE_MEMORY:
+            _, peak = tracemalloc.get_traced_memory()
+            run.peaks[name] = max(run.peaks.get(name, 0), peak - base)
+
+
+def dump_profile():
+    # writes the collected cProfile stats to VC_PROFILE, if profiling is on
+    if _profiler is not None:
+        _profiler.dump_stats(PROFILE_FILE)
+        print(f"cProfile stats written to {PROFILE_FILE}")
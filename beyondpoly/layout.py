@@ -0,0 +1,147 @@
+"""
+Node positions for plot_graph, cached on disk and shared by every script.
+
+Layouts are stored as `<key>-<method>-<seed>.npz` in the cache folder. The key
+is a SHA-1 of the graph's canonical content: sorted labels plus sorted edges.
+Any script that draws the same graph gets the same positions, and reruns skip
+the layout entirely.
+
+Environment variables:
+    VC_LAYOUT=auto|spring|fast   auto uses spring up to FAST_LAYOUT_MIN_NODES
+    VC_LAYOUT_CACHE=<dir>        cache folder (default .layout_cache at the
+                                 repository root), or 0 to turn the cache off
+
+`spring` is nx.spring_layout, which costs O(n^2) per iteration. `fast` is the
+same force model with the repulsion computed on an FFT mesh, see fast_layout.
+"""
+
+import math
+import os
+
+import networkx as nx
+import numpy as np
+
+from beyondpoly import ROOT
+from beyondpoly.graph import as_compact, as_networkx, graph_key
+
+
+LAYOUT_METHOD = os.environ.get("VC_LAYOUT", "auto")
+LAYOUT_CACHE = os.environ.get("VC_LAYOUT_CACHE", os.path.join(ROOT, ".layout_cache"))
+FAST_LAYOUT_MIN_NODES = 1000
+
+
+def _repulsion_kernels(grid):
+    # FFTs of the x and y components of r/|r|^2 on a (2*grid)^2 periodic mesh,
+    # padded so the wrap-around never reaches a real cell
+    size = 2 * grid
+    offset = np.fft.fftfreq(size, 1.0 / size)
+    dx, dy = np.meshgrid(offset, offset, indexing="ij")
+    r2 = dx * dx + dy * dy
+    r2[0, 0] = np.inf
+    return np.fft.rfft2(dx / r2), np.fft.rfft2(dy / r2)
+
+
+def fast_layout(G, seed=42, iterations=60, grid=128):
+    """
+    Fruchterman-Reingold layout with particle-mesh repulsion.
+
+    Spring attraction is summed over the edges with np.bincount. The all-pairs
+    repulsion is approximated by binning the vertices on a grid x grid mesh and
+    convolving the counts with the 1/r force kernel by FFT. Each iteration
+    costs O(n + m + grid^2 log grid) instead of spring_layout's O(n^2).
+
+    Args:
+        G (nx.Graph or CompactGraph): Input graph.
+        seed (int): Seed for the starting positions.
+        iterations (int): Number of cooling steps.
+        grid (int): Mesh resolution for the repulsion.
+
+    Returns:
+        dict: node label -> np.array([x, y]) in [-1, 1], like nx.spring_layout.
+    """
+    C = as_compact(G)
+    n = C.number_of_nodes()
+    if n == 0:
+        return {}
+    eu, ev = C.eu, C.ev
+
+    # ideal edge length 1, so the drawing covers an area of about n
+    side = math.sqrt(n)
+    xy = np.random.default_rng(seed).uniform(-side / 2, side / 2, size=(n, 2))
+    kx, ky = _repulsion_kernels(grid)
+    mesh = (2 * grid, 2 * grid)
+    temperature = side / 10
+
+    for _ in range(iterations):
+        low = xy.min(axis=0)
+        h = max(np.ptp(xy, axis=0).max(), 1e-9) * 1.0001 / grid
+        cell = ((xy - low) / h).astype(np.int64)
+        flat = cell[:, 0] * mesh[1] + cell[:, 1]
+        density = np.bincount(flat, minlength=mesh[0] * mesh[1]).reshape(mesh).astype(float)
+        spectrum = np.fft.rfft2(density)
+        fx = np.fft.irfft2(spectrum * kx, s=mesh).ravel()[flat] / h
+        fy = np.fft.irfft2(spectrum * ky, s=mesh).ravel()[flat] / h
+
+        d = xy[ev] - xy[eu]
+        pull = d * np.sqrt((d * d).sum(axis=1))[:, None]
+        for axis, f in ((0, fx), (1, fy)):
+            f += np.bincount(eu, pull[:, axis], minlength=n) - np.bincount(ev, pull[:, axis], minlength=n)
+        force = np.column_stack([fx, fy])
+        force -= 0.05 * xy  # weak gravity keeps separate components in view
+
+        length = np.maximum(np.sqrt((force * force).sum(axis=1)), 1e-12)[:, None]
+        xy += force / length * np.minimum(length, temperature)
+        temperature *= 0.95
+
+    xy -= (xy.max(axis=0) + xy.min(axis=0)) / 2
+    xy /= max(np.abs(xy).max(), 1e-12)
+    return dict(zip(C.labels.tolist(), xy))
+
+
+def _compute(G, method, seed):
+    if method == "fast":
+        return fast_layout(G, seed)
+    if method == "spring":
+        return nx.spring_layout(as_networkx(G), seed=seed)
+    raise ValueError(f"Unknown layout method: {method}")
+
+
+def graph_layout(G, method=None, seed=42, use_cache=True):
+    """
+    Positions for every node of G, read from the layout cache when present.
+
+    Args:
+        G (nx.Graph or CompactGraph): Graph to lay out.
+        method (str): "auto", "spring" or "fast"; defaults to VC_LAYOUT.
+        seed (int): Layout seed, part of the cache key.
+        use_cache (bool): Read and write the on-disk cache.
+
+    Returns:
+        dict: node label -> np.array([x, y]).
+    """
+    method = method or LAYOUT_METHOD
+    if method == "auto":
+        method = "spring" if G.number_of_nodes() <= FAST_LAYOUT_MIN_NODES else "fast"
+
+    use_cache = use_cache and LAYOUT_CACHE not in ("", "0")
+    key = graph_key(G) if use_cache else None
+    if key is None:
+        return _compute(G, method, seed)
+
+    path = os.path.join(LAYOUT_CACHE, f"{key}-{method}-{seed}.npz")
+    if os.path.exists(path):
+        try:
+            with np.load(path) as data:
+                return dict(zip(data["labels"].tolist(), data["xy"]))
+        except (OSError, KeyError, ValueError):
+            pass  # unreadable entry, compute again
+
+    pos = _compute(G, method, seed)
+    try:
+        os.makedirs(LAYOUT_CACHE, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp, labels=np.array(list(pos), dtype=np.int64), xy=np.array(list(pos.values())))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only location, just skip caching
+    return pos
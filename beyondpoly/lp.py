@@ -0,0 +1,164 @@
+"""
+LP relaxation of vertex cover, solved in-process.
+
+    minimize    sum x_v
+    subject to  x_u + x_v >= 1   for every edge (u, v)
+                0 <= x_v <= 1
+
+The constraint matrix is the m x n edge-vertex incidence matrix, built as a
+scipy.sparse CSR matrix straight from the CompactGraph edge arrays (two
+nonzeros per row), and handed to HiGHS through scipy.optimize.linprog. There
+is no per-edge Python object, no model file and no solver subprocess, and the
+solution comes back as one NumPy array.
+
+half_integral_lp avoids the LP solver altogether. The relaxation always has
+an optimum with every x_v in {0, 1/2, 1}, and one can be read off a minimum
+vertex cover of the bipartite double cover (Nemhauser-Trotter): vertex v gets
+a left copy L_v and a right copy R_v, every edge uv becomes L_u-R_v and
+L_v-R_u, and x_v is half the number of copies of v in the cover. That cover
+comes from a maximum matching (Hopcroft-Karp, in scipy.sparse.csgraph) and
+Konig's theorem, so the whole solve is two C-level graph passes.
+
+scipy is only imported when the LP is actually solved.
+"""
+
+import math
+
+import numpy as np
+
+from beyondpoly.fpt import _remove, adjacency_from_graph, reduce_graph
+from beyondpoly.graph import as_compact
+
+
+# HiGHS returns vertex solutions up to its feasibility tolerance, so 0.5 can
+# come back as 0.4999999...; rounding uses this slack
+ROUNDING_TOLERANCE = 1e-7
+
+
+def incidence_matrix(C):
+    # m x n CSR matrix with a 1 at (edge, endpoint) for both endpoints
+    from scipy.sparse import csr_matrix
+
+    m, n = C.number_of_edges(), C.number_of_nodes()
+    columns = np.empty(2 * m, dtype=np.int64)
+    columns[0::2] = C.eu
+    columns[1::2] = C.ev
+    indptr = np.arange(0, 2 * m + 1, 2, dtype=np.int64)
+    return csr_matrix((np.ones(2 * m), columns, indptr), shape=(m, n))
+
+
+def lp_relaxation(G):
+    """
+    Solves the vertex cover LP relaxation with HiGHS.
+
+    Args:
+        G (nx.Graph or CompactGraph): Input graph.
+
+    Returns:
+        tuple: (labels, x) with x[i] the LP value of vertex labels[i].
+
+    Raises:
+        RuntimeError: if HiGHS does not report an optimal solution.
+    """
+    from scipy.optimize import linprog
+
+    C = as_compact(G)
+    n, m = C.number_of_nodes(), C.number_of_edges()
+    if m == 0:
+        return C.labels, np.zeros(n)
+
+    # x_u + x_v >= 1 written as -x_u - x_v <= -1
+    result = linprog(np.ones(n), A_ub=-incidence_matrix(C), b_ub=-np.ones(m),
+                     bounds=(0, 1), method="highs")
+    if result.status != 0:
+        raise RuntimeError(f"LP solve failed: {result.message}")
+    return C.labels, result.x
+
+
+def half_integral_lp(G):
+    """
+    Half-integral optimum of the vertex cover LP, via the bipartite double cover.
+
+    Args:
+        G (nx.Graph or CompactGraph): Input graph.
+
+    Returns:
+        tuple: (labels, x) with x[i] in {0, 0.5, 1} the LP value of labels[i].
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import breadth_first_order, maximum_bipartite_matching
+
+    C = as_compact(G)
+    n = C.number_of_nodes()
+    if C.number_of_edges() == 0:
+        return C.labels, np.zeros(n)
+
+    # biadjacency of the double cover: row u = L_u, column v = R_v
+    rows = np.concatenate([C.eu, C.ev])
+    cols = np.concatenate([C.ev, C.eu])
+    B = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    left_match = maximum_bipartite_matching(B, perm_type="column")  # R partner of each L, or -1
+
+    # Konig: Z = everything reachable from the unmatched left vertices by
+    # alternating paths (any edge L -> R, matching edge R -> L). The minimum
+    # cover is (L not in Z) + (R in Z). One BFS from a super source at id 2n.
+    matched = np.flatnonzero(left_match >= 0)
+    free = np.flatnonzero(left_match < 0)
+    tails = np.concatenate([rows, n + left_match[matched], np.full(len(free), 2 * n)])
+    heads = np.concatenate([n + cols, matched, free])
+    D = csr_matrix((np.ones(len(tails), dtype=np.int8), (tails, heads)), shape=(2 * n + 1, 2 * n + 1))
+    reached = np.zeros(2 * n + 1, dtype=bool)
+    reached[breadth_first_order(D, 2 * n, directed=True, return_predecessors=False)] = True
+
+    x = ((~reached[:n]).astype(float) + reached[n:2 * n]) / 2
+    return C.labels, x
+
+
+def lp_kernel(G):
+    """
+    Shrinks G to its half-integral LP core, fixing vertices on the way.
+
+    Nemhauser-Trotter persistence: some minimum cover contains every vertex
+    with x = 1 in a half-integral optimum and no vertex with x = 0, so only the
+    x = 1/2 vertices need an exact search. The core left by one LP solve is
+    often much larger than necessary (the matching picks an arbitrary optimum),
+    so the LP is alternated with the degree 0/1 and triangle rules of
+    fpt.reduce_graph (no folding, no budget) until neither fixes anything.
+    G is converted to a CompactGraph once, and each LP round solves the
+    subgraph induced by the vertices still left. The optimum of G is
+    len(forced) plus the optimum of the core, and each core component needs at
+    least half its vertices.
+
+    Returns:
+        tuple: (forced, core) with forced the fixed cover vertices and core the
+        remaining x = 1/2 vertices.
+    """
+    C = as_compact(G)
+    index = {v: i for i, v in enumerate(C.labels.tolist())}
+    adj = adjacency_from_graph(C)
+    forced = set()
+    while True:
+        before = len(adj)
+        forced |= reduce_graph(adj, math.inf, fold=False)[0]
+        changed = len(adj) < before  # every rule that fires drops a vertex
+        # only vertices are ever removed, so the induced subgraph is exactly adj
+        H = C.subgraph(np.array(sorted(index[v] for v in adj), dtype=np.int64))
+        if H.number_of_edges() == 0:
+            break
+        labels, x = half_integral_lp(H)
+        for v in labels[x == 1].tolist():
+            forced.add(v)
+            _remove(adj, v)
+            changed = True
+        for v in labels[x == 0].tolist():
+            if v in adj:  # its neighbours all had x = 1 and are gone
+                del adj[v]
+                changed = True
+        if not changed:
+            break
+    return forced, [v for v, nbrs in adj.items() if nbrs]
+
+
+def round_half(labels, x):
+    # the usual 2-approximation: every vertex with x >= 1/2
+    return labels[x >= 0.5 - ROUNDING_TOLERANCE].tolist()
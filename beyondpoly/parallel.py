@@ -0,0 +1,88 @@
+"""
+Multi-core exhaustive vertex cover search.
+
+Sizes are tried in increasing order. Within one size the combinations are split
+by a fixed prefix of vertex choices; prefixes are handed out in lexicographic
+order, so the prefix rank orders the work exactly like the serial scan. Workers
+share the rank of the earliest prefix that produced a cover and give up as soon
+as an earlier prefix has one, which keeps the result identical to
+find_smallest_vertex_cover. Each prefix is completed with the pruned search
+of bitmask.first_cover.
+"""
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from beyondpoly.bitmask import build_neighbour_masks, first_cover, is_vertex_cover_mask, subset_to_mask, suffix_unions
+
+
+_masks = None
+_suffix = None
+_best_rank = None
+
+
+def _init_worker(masks, best_rank):
+    global _masks, _suffix, _best_rank
+    _masks = masks
+    _suffix = suffix_unions(masks)
+    _best_rank = best_rank
+
+
+def _search_prefix(rank, prefix, size):
+    if _best_rank.value < rank:
+        return None  # an earlier prefix already holds the lexicographically first cover
+    base = subset_to_mask(prefix)
+    start = prefix[-1] + 1
+    need = 0
+    for i in range(start):
+        if not (base >> i) & 1:
+            need |= _masks[i]  # left out by the prefix, so its neighbours are needed
+    subset = first_cover(_masks, size, start, base, need, _suffix)
+    if subset is None:
+        return None
+    with _best_rank.get_lock():
+        if rank < _best_rank.value:
+            _best_rank.value = rank
+    return rank, subset
+
+
+def _prefixes(n, size, prefix_len):
+    # prefixes that still leave enough vertices after them to complete a subset of `size`
+    p = min(prefix_len, size)
+    for prefix in combinations(range(n), p):
+        if prefix[-1] <= n - (size - p) - 1:
+            yield prefix
+
+
+def parallel_smallest_vertex_cover(G, workers=None, prefix_len=2):
+    """
+    Returns the lexicographically first smallest vertex cover of G as a tuple,
+    in the same vertex order and with the same tie-breaking as the serial scan.
+
+    Args:
+        G (nx.Graph): Input graph.
+        workers (int): Number of processes, defaults to os.cpu_count().
+        prefix_len (int): Vertices fixed per task; more gives smaller tasks.
+    """
+    vertices = list(G.nodes())
+    n = len(vertices)
+    masks = build_neighbour_masks(G, vertices)
+    if is_vertex_cover_mask(masks, 0):
+        return ()
+
+    best_rank = mp.Value("q", 0)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             initializer=_init_worker, initargs=(masks, best_rank)) as pool:
+        for size in range(1, n + 1):
+            prefixes = list(_prefixes(n, size, prefix_len))
+            best_rank.value = len(prefixes)
+            futures = [pool.submit(_search_prefix, rank, prefix, size)
+                       for rank, prefix in enumerate(prefixes)]
+            found = [f.result() for f in futures]
+            found = [hit for hit in found if hit is not None]
+            if found:
+                _, subset = min(found)
+                return tuple(vertices[i] for i in subset)
+    return ()
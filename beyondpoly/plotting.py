@@ -0,0 +1,174 @@
+"""
+Plot modes shared by the scripts, picked with the VC_PLOT environment variable:
+    show        draw and open the matplotlib windows (default, the old behaviour)
+    headless    Agg backend, only the PNG files are written
+    none        nothing is drawn and no layout is computed
+    background  Agg backend, PNGs are rendered by a pool of worker processes
+                (VC_PLOT_WORKERS, default 2) while the solvers keep running
+
+A figure is described as a list of panels. A panel is a plain dict of NumPy
+arrays (labels, coordinates, edge endpoints, highlight mask), so it can be
+pickled to a worker.
+
+Panels are drawn with nx.draw up to FAST_RENDER_MIN_NODES vertices. Above that,
+edges are drawn as one LineCollection and each vertex class as one scatter
+call (VC_PLOT_RENDERER=auto|networkx|fast overrides the choice). Labels are
+dropped above LABEL_MAX_NODES vertices. Only a seeded sample of
+VC_PLOT_MAX_EDGES edges is drawn.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import numpy as np
+
+PLOT_MODES = ("show", "headless", "none", "background")
+PLOT_MODE = os.environ.get("VC_PLOT", "show")
+PLOT_WORKERS = int(os.environ.get("VC_PLOT_WORKERS", "2"))
+PLOT_RENDERER = os.environ.get("VC_PLOT_RENDERER", "auto")
+MAX_DRAWN_EDGES = int(os.environ.get("VC_PLOT_MAX_EDGES", "200000"))
+FAST_RENDER_MIN_NODES = 300
+LABEL_MAX_NODES = 100
+
+if PLOT_MODE not in PLOT_MODES:
+    raise ValueError(f"Unknown plot mode: {PLOT_MODE}, expected one of {', '.join(PLOT_MODES)}")
+if PLOT_MODE != "show":
+    matplotlib.use("Agg", force=True)
+
+import matplotlib.pyplot as plt
+import networkx as nx
+from matplotlib.collections import LineCollection
+
+from beyondpoly.graph import as_compact
+
+
+_pool = None
+_pending = []
+
+
+def plotting_enabled():
+    return PLOT_MODE != "none"
+
+
+def graph_panel(G, pos, highlight_nodes=None, title="Graph", node_size=400, highlight_size=400,
+                row=0, col=0):
+    # G may be an nx.Graph or a CompactGraph; row/col place the panel in a subplot grid
+    C = as_compact(G)
+    labels = C.labels.tolist()
+    xy = np.array([pos[v] for v in labels], dtype=float).reshape(len(labels), 2)
+    chosen = set(highlight_nodes or [])
+    highlight = np.fromiter((v in chosen for v in labels), dtype=bool, count=len(labels))
+    return {"labels": C.labels, "xy": xy, "eu": C.eu, "ev": C.ev, "highlight": highlight,
+            "title": title, "node_size": node_size, "highlight_size": highlight_size,
+            "row": row, "col": col}
+
+
+def _draw_networkx(ax, panel, with_labels):
+    labels = panel["labels"].tolist()
+    G = nx.Graph()
+    G.add_nodes_from(labels)
+    G.add_edges_from(zip(panel["labels"][panel["eu"]].tolist(), panel["labels"][panel["ev"]].tolist()))
+    pos = dict(zip(labels, panel["xy"]))
+
+    nx.draw(G, pos, with_labels=with_labels, node_color='lightblue',
+            edge_color='gray', node_size=panel["node_size"], ax=ax)
+    if panel["highlight"].any():
+        nx.draw_networkx_nodes(G, pos, nodelist=panel["labels"][panel["highlight"]].tolist(),
+                               node_color='orange', node_size=panel["highlight_size"], ax=ax)
+
+
+def _draw_fast(ax, panel, with_labels):
+    # one LineCollection for the edges and one scatter per vertex class
+    xy, eu, ev, highlight = panel["xy"], panel["eu"], panel["ev"], panel["highlight"]
+    n = len(xy)
+    if len(eu) > MAX_DRAWN_EDGES:
+        pick = np.random.default_rng(0).choice(len(eu), MAX_DRAWN_EDGES, replace=False)
+        eu, ev = eu[pick], ev[pick]
+    width = 0.8 if len(eu) < 10_000 else 0.2
+    ax.add_collection(LineCollection(np.stack([xy[eu], xy[ev]], axis=1), colors='gray',
+                                     linewidths=width, alpha=0.6, zorder=1))
+
+    # marker area shrinks with n so the points stay apart
+    size = min(panel["node_size"], max(1.0, 40_000 / n)) if n else 0
+    scale = panel["highlight_size"] / panel["node_size"]
+    ax.scatter(xy[~highlight, 0], xy[~highlight, 1], s=size, c='lightblue', linewidths=0, zorder=2)
+    ax.scatter(xy[highlight, 0], xy[highlight, 1], s=size * scale, c='orange', linewidths=0, zorder=3)
+    if with_labels:
+        for (x, y), label in zip(xy.tolist(), panel["labels"].tolist()):
+            ax.text(x, y, str(label), fontsize=8, ha='center', va='center', zorder=4)
+    ax.autoscale_view()
+
+
+def draw_panel(ax, panel):
+    n = len(panel["labels"])
+    fast = PLOT_RENDERER == "fast" or (PLOT_RENDERER == "auto" and n > FAST_RENDER_MIN_NODES)
+    if fast:
+        _draw_fast(ax, panel, n <= LABEL_MAX_NODES)
+    else:
+        _draw_networkx(ax, panel, n <= LABEL_MAX_NODES)
+    ax.set_title(panel["title"])
+    ax.axis('off')
+
+
+def _draw_figure(path, panels, nrows, ncols, figsize, suptitle):
+    fig, axs = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize, squeeze=False)
+    for panel in panels:
+        draw_panel(axs[panel["row"], panel["col"]], panel)
+    if nrows * ncols > 1:
+        # grid cells that never got a panel stay blank
+        used = {(panel["row"], panel["col"]) for panel in panels}
+        for r in range(nrows):
+            for c in range(ncols):
+                if (r, c) not in used:
+                    axs[r, c].axis('off')
+    if suptitle:
+        fig.suptitle(suptitle)
+    if path:
+        fig.savefig(path)
+    return fig
+
+
+def _render(path, panels, nrows, ncols, figsize, suptitle):
+    # runs in a worker process
+    plt.close(_draw_figure(path, panels, nrows, ncols, figsize, suptitle))
+
+
+def render_figure(path, panels, nrows=1, ncols=1, figsize=(8, 6), suptitle=None):
+    """
+    Draws the panels into one figure and saves it to path, if path is given.
+
+    In show mode the figure stays open for show(). In headless mode it is closed
+    after saving. In background mode the drawing is queued on the worker pool.
+    Outside show mode a figure without a path is skipped, nobody would see it.
+    """
+    global _pool
+    if PLOT_MODE == "none" or (path is None and PLOT_MODE != "show"):
+        return
+    if PLOT_MODE == "background":
+        if _pool is None:
+            _pool = ProcessPoolExecutor(PLOT_WORKERS)
+        _pending.append(_pool.submit(_render, path, panels, nrows, ncols, figsize, suptitle))
+        return
+    fig = _draw_figure(path, panels, nrows, ncols, figsize, suptitle)
+    if PLOT_MODE == "headless":
+        plt.close(fig)
+
+
+def show():
+    # stands in for plt.show(), which would block in every mode but "show"
+    if PLOT_MODE == "show":
+        plt.show()
+    else:
+        plt.close("all")
+
+
+def wait_for_renders():
+    # blocks until every queued background render is written
+    global _pool
+    for future in _pending:
+        future.result()
+    _pending.clear()
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -0,0 +1,141 @@
+"""
+On-disk memoization of solver results.
+
+An entry is keyed by the graph's content hash (graph.graph_key) plus the solver
+name, version and parameters, the graph representation (networkx or
+CompactGraph) and the vertex order, since exhaustive solvers break ties
+between equally small covers by that order. It stores the cover, as the same
+tuple or list the solver returned, its size and the time the original solve
+took. Entries are `<key>.npz` files in the cache folder. A hit touches the
+file's mtime, and when the folder grows past its size budget the least
+recently used entries are deleted first.
+
+Environment variables:
+    VC_RESULT_CACHE=<dir>     cache folder (default .result_cache at the
+                              repository root), or 0 to turn the cache off
+    VC_RESULT_CACHE_MB=<mb>   size budget, default 256
+    VC_NO_CACHE=1             bypass: always solve, never read or write
+
+Bump the version passed by a script whenever its solver changes, so stale
+covers are never served.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from beyondpoly import ROOT
+from beyondpoly.graph import CompactGraph, graph_key
+
+
+CACHE_DIR = os.environ.get("VC_RESULT_CACHE", os.path.join(ROOT, ".result_cache"))
+MAX_BYTES = int(float(os.environ.get("VC_RESULT_CACHE_MB", "256")) * (1 << 20))
+BYPASS = os.environ.get("VC_NO_CACHE", "0") == "1"
+
+
+def cache_enabled():
+    return not BYPASS and CACHE_DIR not in ("", "0")
+
+
+def _vertex_order(G):
+    # digest of the node iteration order, which decides ties between covers
+    labels = G.labels if isinstance(G, CompactGraph) else np.fromiter(G.nodes(), dtype=np.int64)
+    return hashlib.sha1(np.ascontiguousarray(labels, dtype=np.int64).tobytes()).hexdigest()
+
+
+def result_key(G, solver, version=1, params=None):
+    # None when the graph cannot be hashed (non-integer labels)
+    graph = graph_key(G)
+    if graph is None:
+        return None
+    spec = json.dumps({"solver": solver, "version": version, "params": params or {},
+                       "representation": "compact" if isinstance(G, CompactGraph) else "networkx",
+                       "order": _vertex_order(G)},
+                      sort_keys=True, default=str)
+    return hashlib.sha1((graph + spec).encode()).hexdigest()
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, key + ".npz")
+
+
+def lookup(key):
+    # (cover, size, time_taken) or None; a hit refreshes the entry's LRU stamp
+    path = _path(key)
+    try:
+        with np.load(path) as data:
+            cover = data["cover"].tolist()
+            if str(data["kind"]) == "tuple":
+                cover = tuple(cover)
+            size = int(data["size"])
+            time_taken = float(data["time"])
+    except (OSError, KeyError, ValueError):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return cover, size, time_taken
+
+
+def store(key, cover, time_taken):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{_path(key)}.{os.getpid()}.tmp.npz"
+        kind = "list" if isinstance(cover, list) else "tuple"
+        np.savez(tmp, cover=np.array(list(cover), dtype=np.int64), size=len(cover), time=time_taken, kind=kind)
+        os.replace(tmp, _path(key))
+    except (OSError, TypeError, ValueError):
+        return  # read-only folder or non-integer labels, just skip caching
+    evict()
+
+
+def evict(max_bytes=MAX_BYTES):
+    # deletes least recently used entries until the folder fits in max_bytes
+    entries = []
+    with os.scandir(CACHE_DIR) as listing:
+        for entry in listing:
+            if entry.name.endswith(".npz") and ".tmp." not in entry.name:
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # another process got there first
+        total -= size
+
+
+def cached_solve(G, solver, solve, version=1, params=None, use_cache=True):
+    """
+    Runs solve(G), or returns the stored result for the same graph and solver.
+
+    Args:
+        G (nx.Graph or CompactGraph): Input graph.
+        solver (str): Solver name, part of the key.
+        solve (callable): solve(G) -> (cover, time_taken), as the scripts' solvers return.
+        version (int): Solver version, part of the key.
+        params (dict): Anything else that changes the result, part of the key.
+        use_cache (bool): False bypasses the cache for this call.
+
+    Returns:
+        tuple: (cover, time_taken). On a hit time_taken is the time of the
+        original solve, so output rows stay comparable across reruns.
+    """
+    key = result_key(G, solver, version, params) if use_cache and cache_enabled() else None
+    if key is not None:
+        hit = lookup(key)
+        if hit is not None:
+            cover, size, time_taken = hit
+            print(f"{solver}: cached result ({size} vertices)")
+            return cover, time_taken
+
+    cover, time_taken = solve(G)
+    if key is not None:
+        store(key, cover, time_taken)
+    return cover, time_taken
@@ -0,0 +1,253 @@
+"""
+Buffered result sink shared by the output writers.
+
+Rows are kept in memory and appended to the CSV in batches: once `batch_size`
+rows or `flush_seconds` have piled up (checked on the next add), and on close.
+add() returns the buffered row, which stays editable until that next add, so
+a caller can attach values only known afterwards, such as the write timing.
+Each flush opens the file once and holds an exclusive lock on it (fcntl,
+where available) while it checks for the header and writes. Several worker processes can therefore share one output
+file without interleaving rows or writing the header twice.
+
+With VC_COLUMNAR=npz or parquet, each flush also writes a columnar part file
+next to the CSV, `<name>.<pid>-<seq>.npz` or `.parquet`. In these files
+covers are integer arrays (CSR values + offsets in npz, list<int64> in
+parquet), not Python repr strings. The sequence number is shared by every
+sink in the process and skips names already on disk, so neither concurrent
+writers nor a reopened sink overwrite a part. read_columnar() joins the parts
+back together, padding columns a part does not have. Parquet needs pyarrow;
+without it the sink falls back to npz.
+"""
+
+import atexit
+import csv
+import glob
+import itertools
+import os
+import time
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single writer assumed
+    fcntl = None
+
+
+COLUMNAR_FORMAT = os.environ.get("VC_COLUMNAR", "")
+COVER_FIELD = "Solution"
+
+# part numbers are per process, not per sink, so a sink reopened on the same
+# path after close_sinks() carries on from where the last one stopped
+_part_numbers = itertools.count()
+
+
+def _columnar_base(path):
+    return os.path.splitext(path)[0]
+
+
+class ResultSink:
+    def __init__(self, path, fields=None, batch_size=64, flush_seconds=5.0, columnar=None):
+        """
+        Args:
+            path (str): CSV file to append to.
+            fields (list): Leading column order; keys of later rows are appended.
+            batch_size (int): Rows buffered before a flush.
+            flush_seconds (float): Longest time a buffered row waits.
+            columnar (str): "npz", "parquet" or None; defaults to VC_COLUMNAR.
+        """
+        self.path = path
+        self.fields = list(fields) if fields else []
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.columnar = columnar if columnar is not None else COLUMNAR_FORMAT
+        self.rows = []
+        self.last_flush = time.monotonic()
+
+    def add(self, row):
+        # the buffer is flushed before, never after, appending the row
+        if len(self.rows) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_seconds:
+            self.flush()
+        self.rows.append(row)
+        return row
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        for row in rows:
+            self.fields.extend(key for key in row if key not in self.fields)
+        with open(self.path, 'a+', newline='') as out:
+            if fcntl is not None:
+                fcntl.flock(out, fcntl.LOCK_EX)
+            try:
+                out.seek(0)
+                header = next(csv.reader(out), None)
+                if header is None:
+                    header = list(self.fields)
+                    csv.writer(out).writerow(header)
+                elif any(field not in header for field in self.fields):
+                    header = self._widen(out, header)
+                # the file's header wins, so writers with other column orders agree
+                self.fields.extend(field for field in header if field not in self.fields)
+                out.seek(0, os.SEEK_END)
+                csv.DictWriter(out, fieldnames=header).writerows(rows)
+                out.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(out, fcntl.LOCK_UN)
+        if self.columnar:
+            self._write_part(rows)
+
+    def _widen(self, out, header):
+        # rewrites the file with the new columns appended to its header
+        out.seek(0)
+        old_rows = list(csv.DictReader(out))
+        header = header + [field for field in self.fields if field not in header]
+        out.seek(0)
+        out.truncate()
+        writer = csv.DictWriter(out, fieldnames=header)
+        writer.writeheader()
+        writer.writerows(old_rows)
+        return header
+
+    def _write_part(self, rows):
+        columns = {}
+        covers = []
+        for field in self.fields:
+            values = [row.get(field) for row in rows]
+            if field == COVER_FIELD:
+                covers = [np.asarray(list(v) if v is not None and not isinstance(v, str) else [], dtype=np.int64)
+                          for v in values]
+            else:
+                columns[field] = values
+
+        base = _part_base(self.path)
+        if self.columnar == "parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                print("pyarrow is not installed, writing npz instead")
+                self.columnar = "npz"
+            else:
+                table = {name: pa.array([None if v == "" else v for v in values])
+                         for name, values in _typed(columns).items()}
+                table["cover"] = pa.array([c.tolist() for c in covers], type=pa.list_(pa.int64()))
+                pq.write_table(pa.table(table), base + ".parquet")
+                return
+
+        offsets = np.zeros(len(covers) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(c) for c in covers])
+        values = np.concatenate(covers) if covers else np.zeros(0, dtype=np.int64)
+        arrays = {f"col_{name}": np.asarray(values_) for name, values_ in _typed(columns).items()}
+        np.savez(base + ".npz", cover_values=values, cover_offsets=offsets, **arrays)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _part_base(path):
+    # first unused `<name>.<pid>-<seq>`; the pid may repeat across runs
+    prefix = f"{_columnar_base(path)}.{os.getpid()}"
+    while True:
+        base = f"{prefix}-{next(_part_numbers):06d}"
+        if not glob.glob(glob.escape(base) + ".*"):
+            return base
+
+
+def _typed(columns):
+    # numbers stay numbers (NaN where a row lacks the column), anything mixed
+    # or textual becomes str; columns no row in the part has are left out
+    typed = {}
+    for name, values in columns.items():
+        present = [v for v in values if v is not None]
+        if not present:
+            continue
+        if all(isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, bool) for v in present):
+            typed[name] = values if len(present) == len(values) else [np.nan if v is None else v for v in values]
+        else:
+            typed[name] = ["" if v is None else str(v) for v in values]
+    return typed
+
+
+def read_columnar(path):
+    """
+    Joins the columnar parts written for a CSV path.
+
+    Parts written before a column first appeared do not have it; those rows
+    get NaN in numeric columns and "" in text columns. A column that is
+    numeric in one part and text in another comes back as text.
+
+    Returns:
+        dict: column name -> np.array, plus "cover" -> list of int64 arrays.
+    """
+    base = _columnar_base(path)
+    covers = []
+    parts = []  # (rows, {column: array}) per part file
+    for part in sorted(glob.glob(glob.escape(base) + ".*-*.npz")):
+        with np.load(part) as data:
+            offsets = data["cover_offsets"]
+            values = data["cover_values"]
+            covers.extend(np.split(values, offsets[1:-1]) if len(offsets) > 1 else [])
+            parts.append((len(offsets) - 1, {key[4:]: data[key] for key in data.files if key.startswith("col_")}))
+    parquet = sorted(glob.glob(glob.escape(base) + ".*-*.parquet"))
+    if parquet:
+        import pyarrow.parquet as pq
+        for part in parquet:
+            table = pq.read_table(part).to_pydict()
+            cover = table.pop("cover")
+            covers.extend(np.asarray(c, dtype=np.int64) for c in cover)
+            parts.append((len(cover), {key: np.asarray(values) for key, values in table.items()}))
+
+    result = {"cover": covers}
+    for name in dict.fromkeys(name for _, columns in parts for name in columns):
+        result[name] = _join_column([(rows, columns.get(name)) for rows, columns in parts])
+    return result
+
+
+def _join_column(pieces):
+    # pieces: (rows, array or None) per part, None where the part lacks the column
+    present = [array for _, array in pieces if array is not None]
+    if all(array.dtype.kind in "iuf" for array in present):
+        if len(present) == len(pieces):
+            return np.concatenate(present)
+        return np.concatenate([np.full(rows, np.nan) if array is None else array.astype(float)
+                               for rows, array in pieces])
+    return np.concatenate([np.full(rows, "", dtype=object) if array is None
+                           else np.array(["" if v is None else str(v) for v in array.tolist()], dtype=object)
+                           for rows, array in pieces]).astype(str)
+
+
+def reset_output(path):
+    # removes a CSV and its columnar parts before a fresh run
+    base = _columnar_base(path)
+    for name in [path, *glob.glob(glob.escape(base) + ".*-*.npz"), *glob.glob(glob.escape(base) + ".*-*.parquet")]:
+        if os.path.exists(name):
+            os.remove(name)
+
+
+_sinks = {}
+
+
+def result_sink(path, **options):
+    # one shared sink per output path, flushed by close_sinks() or at exit
+    if path not in _sinks:
+        _sinks[path] = ResultSink(path, **options)
+    return _sinks[path]
+
+
+def close_sinks():
+    for sink in _sinks.values():
+        sink.close()
+    _sinks.clear()
+
+
+atexit.register(close_sinks)
@@ -1,6 +1,12 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-from itertools import combinations
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from beyondpoly.bitmask import smallest_vertex_cover as exhaustive_vertex_cover
+from beyondpoly.graphio import load_edge_list
+from beyondpoly.layout import graph_layout
+from beyondpoly.plotting import graph_panel, plotting_enabled, render_figure, show
 
 class Graph:
     def __init__(self):
@@ -15,14 +21,6 @@ class Graph:
         for node in self.G.nodes():
             print(f"{node} -> {' '.join(str(neigh) for neigh in self.G.neighbors(node))}")
 
-    def generate_subsets(self):
-        vertices = list(self.G.nodes())
-        subsets = []
-        # Generate all subsets using combinations of different sizes
-        for r in range(len(vertices) + 1):
-            subsets.extend(combinations(vertices, r))
-        return subsets
-
     def is_vertex_cover(self, subset):
         covered_edges = set()
         subset_set = set(subset)
@@ -35,15 +33,8 @@ class Graph:
         return covered_edges == all_edges
 
     def verify_and_find_smallest_vertex_cover(self):
-        subsets = self.generate_subsets()
-        min_size = len(self.G.nodes()) + 1
-        self.smallest_vertex_cover = []
-
-        for subset in subsets:
-            if self.is_vertex_cover(subset):
-                if len(subset) < min_size:
-                    min_size = len(subset)
-                    self.smallest_vertex_cover = subset
+        # subsets come in increasing size, so the first cover found is a smallest one
+        self.smallest_vertex_cover = exhaustive_vertex_cover(self.G)
 
         if self.smallest_vertex_cover:
             print("\nSmallest Vertex Cover:")
@@ -54,29 +45,19 @@ class Graph:
 
     def read_from_file(self, filename):
         try:
-            with open(filename, 'r') as fin:
-                n, m = map(int, fin.readline().split())
-                for _ in range(m):
-                    u, v = map(int, fin.readline().split())
-                    self.add_edge(u, v)
+            n, m, us, vs = load_edge_list(filename)
+            self.G.add_edges_from(zip(us.tolist(), vs.tolist()))
             return True
         except IOError:
             print(f"Error opening file: {filename}")
             return False
 
     def plot_graph(self, highlight_nodes=None, title="Graph"):
-        pos = nx.spring_layout(self.G, seed=42)  # Fixed layout for consistency
-        plt.figure(figsize=(8, 6))
-        nx.draw(self.G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=700)
-
-        if highlight_nodes:
-            nx.draw_networkx_nodes(self.G, pos,
-                                   nodelist=highlight_nodes,
-                                   node_color='orange',
-                                   node_size=900)
-
-        plt.title(title)
-        plt.show()
+        if not plotting_enabled():
+            return
+        pos = graph_layout(self.G)  # Fixed layout for consistency, cached on disk
+        render_figure(None, [graph_panel(self.G, pos, highlight_nodes, title, node_size=700, highlight_size=900)])
+        show()
 
 
 def main():
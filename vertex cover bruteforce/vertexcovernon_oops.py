@@ -1,26 +1,20 @@
 # GEN AI is used in one of the functions i.e is_vertex_cover(g,subset)
 # GFG reference for generate subsets 
 
-import networkx as nx
-import matplotlib.pyplot as plt
-from itertools import combinations
 import time
-import csv
 import os
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from beyondpoly.baselines import record
+from beyondpoly.bitmask import smallest_vertex_cover as exhaustive_vertex_cover
+from beyondpoly.graphio import read_graph, read_graph_size
+from beyondpoly.instrument import current_run, dump_profile, new_run, phase
+from beyondpoly.layout import graph_layout
+from beyondpoly.plotting import graph_panel, plotting_enabled, render_figure, show, wait_for_renders
+from beyondpoly.resultcache import cached_solve
+from beyondpoly.sink import close_sinks, reset_output, result_sink
 
-def read_graph(filename):
-    G = nx.Graph()
-    try:
-        with open(filename, 'r') as file:
-            n, m = map(int, file.readline().split())
-            for _ in range(m):
-                u, v = map(int, file.readline().split()) 
-                G.add_edge(u, v)
-    except IOError:
-        print(f"Error opening file: {filename}")
-        return None
-    return G
 
 def print_graph(G):
     print(G)
@@ -30,12 +24,6 @@ def print_graph(G):
         print(f"{node}: {list(neighbors)}")
 
 
-def generate_subsets(v): # Geek For Geeks
-    subsets = []
-    for r in range(len(v) + 1):
-        subsets.extend(combinations(v, r)) # array of tuples
-    return subsets
-
 def is_vertex_cover(G, subset): # GEN AI PART
     covered_edges = set()
     subset_set = set(subset)
@@ -48,17 +36,10 @@ def is_vertex_cover(G, subset): # GEN AI PART
 
 def find_smallest_vertex_cover(G):
     start=time.time()
-    vertices = list(G.nodes())
-    subsets = generate_subsets(vertices)
-    
-    min_size = len(vertices) + 1 
-    smallest_vertex_cover = []
+    # subsets come in increasing size, so the first cover found is a smallest one
+    smallest_vertex_cover = exhaustive_vertex_cover(G)
 
-    for subset in subsets:
-        if is_vertex_cover(G, subset):
-            if len(subset) < min_size:
-                min_size = len(subset)
-                smallest_vertex_cover = subset
+    end=time.time()  # stop the clock before printing
 
     if smallest_vertex_cover:
         print("\nSmallest Vertex Cover:")
@@ -67,71 +48,62 @@ def find_smallest_vertex_cover(G):
     else:
         print("\n No vertex cover found")
     
-    end=time.time()
     return smallest_vertex_cover, end-start
 
 
 def plot_graph(G, highlight_nodes=None, title="Graph", pos=None, number=None):
+    if not plotting_enabled():
+        return pos
     if not pos:
-        pos = nx.spring_layout(G) 
+        pos = graph_layout(G)  # seeded and cached, see beyondpoly/layout.py
     
     # fixed layout for consistency , can also pass a seed as attribute for consistency across the devices 
     # pos above return the dictionary position of each vertex 
     # print(pos)
     
-    plt.figure(figsize=(8, 6))
-    nx.draw(G, pos, with_labels=True, node_color='lightblue', edge_color='gray', node_size=700)
-    if highlight_nodes:
-        nx.draw_networkx_nodes(G, pos, nodelist=highlight_nodes, node_color='orange', node_size=900)
-    plt.title(title)
-    if (highlight_nodes):
-        plt.savefig(f"output{number}.png")   
-
-    plt.show()
+    path = f"output{number}.png" if highlight_nodes else None
+    render_figure(path, [graph_panel(G, pos, highlight_nodes, title, node_size=700, highlight_size=900)])
+    show()
         
     return pos
 
 
 def writeoutput(solution, time, m, n):
-    fileEmptyCheck = (not os.path.exists("output.csv")) or (os.path.getsize("output.csv") == 0)
+    # buffered, see beyondpoly/sink.py
+    return result_sink("output.csv").add({"Input size": f"{m},{n}", "Solution": solution, "Time Taken": time})
 
-    if fileEmptyCheck:
-        with open("output.csv", 'w', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow(["Input size", "Solution", "Time Taken"])
-            writer.writerow([f"{m},{n}", solution, time])
-    else:
-        with open("output.csv", 'a', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow([f"{m},{n}", solution, time])
 
-        
 # Main function 
 def main():
-    if os.path.exists("output.csv"):
-        os.remove("output.csv")
+    reset_output("output.csv")
     for i in range(1,5):
         filename = f"input{i}.txt"
-        G = read_graph(filename)
+        new_run()
+        with phase("parse"):
+            G = read_graph(filename)
         if G is None:
             return
 
         print_graph(G)
-        postion = plot_graph(G, title="Original Graph") 
+        with phase("plot"):
+            postion = plot_graph(G, title="Original Graph") 
         # saving the position of input graph before showing the output
 
-        Solution, time = find_smallest_vertex_cover(G)
-        plot_graph(G, highlight_nodes=Solution, title="Graph Highlighting Smallest Vertex Cover", pos=postion, number=i)
+        with phase("solve"):
+            Solution, time = cached_solve(G, "bruteforce", find_smallest_vertex_cover)
+        record(G, "optimal", len(Solution), source=filename)
+        with phase("plot"):
+            plot_graph(G, highlight_nodes=Solution, title="Graph Highlighting Smallest Vertex Cover", pos=postion, number=i)
         print(f"total time taken {time}s")
         
-        if i ==1:
-            writeoutput(Solution, time, 10,10)
-        elif i ==2 :
-            writeoutput(Solution, time, 10,20)
-        elif i ==3 :
-            writeoutput(Solution, time, 10,30)
-        elif i ==4 :
-            writeoutput(Solution, time, 10,40)
+        n, m = read_graph_size(filename)
+        with phase("write"):
+            row = writeoutput(Solution, time, n, m)
+        row.update(current_run().as_row())  # after the write phase closed, so write_s is in
+
+    close_sinks()
+    dump_profile()
+    wait_for_renders()
 
 if __name__ == "__main__":
     main()
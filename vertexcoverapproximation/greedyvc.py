@@ -5,145 +5,115 @@ to maintain consistency
 run this file to see the results 
  '''
  
-# gen AI is used in one of the functions i.e ast library (Abstract Syntax Trees) 
-# used for parsing string to tuple/list
 
-
-import networkx as nx
-import matplotlib.pyplot as plt
 import time
-import csv
 import os
-import ast
-
-
-
-def read_graph(filename):
-    G = nx.Graph()
-    try:
-        with open(filename, 'r') as file:
-            n, m = map(int, file.readline().split())
-            for _ in range(m):
-                u, v = map(int, file.readline().split())
-                G.add_edge(u, v)
-    except IOError:
-        print(f"Error opening file: {filename}")
-        return None
-    return G
-
-
-def greedy_vertex_cover(G):
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from beyondpoly.baselines import approximation_factor, record
+from beyondpoly.components import run_solver
+from beyondpoly.graphio import read_compact_graph, read_graph_size
+from beyondpoly.instrument import current_run, dump_profile, new_run, phase
+from beyondpoly.layout import graph_layout
+from beyondpoly.matching import greedy_vertex_cover
+from beyondpoly.plotting import graph_panel, plotting_enabled, render_figure, show, wait_for_renders
+from beyondpoly.sink import close_sinks, reset_output, result_sink
+from beyondpoly.streaming import streaming_vertex_cover
+
+
+def stream_vertex_cover(filename):
+    # same 2-approximation built in one pass over the file, without a graph
     start = time.time()
+    cover, _ = streaming_vertex_cover(filename)
+    end = time.time()
+    return cover.tolist(), end - start
 
-    # Find a maximal matching
-    matching = nx.maximal_matching(G)
-
-    # Build the vertex cover from matched edges
-    cover = set()
-    for u, v in matching:
-        cover.add(u)
-        cover.add(v)
 
-    end = time.time()
-    return list(cover), end - start
+# VC_STREAM=1 builds the matching straight from the input file in one pass
+STREAM_MODE = os.environ.get("VC_STREAM", "0") == "1"
 
 
 def plot_graph(G, highlight_nodes=None, title="Graph", pos=None, number=None):
+    if not plotting_enabled():
+        return pos
     if not pos:
-        pos = nx.spring_layout(G)
+        pos = graph_layout(G)  # seeded and cached, see beyondpoly/layout.py
 
     
     # fixed layout for consistency , can also pass a seed as attribute for consistency across the devices 
     # pos above return the dictionary position of each vertex 
     # print(pos)
     
-    plt.figure(figsize=(8, 6))
-
-    nx.draw(G, pos, with_labels=True, node_color='lightblue',
-            edge_color='gray', node_size=700)
-
-    if highlight_nodes:
-        nx.draw_networkx_nodes(
-            G, pos, nodelist=highlight_nodes, node_color='orange', node_size=900)
-    plt.title(title)
-
-    if highlight_nodes:
-        plt.savefig(f"output{number}.png")
-    plt.show()
+    path = f"output{number}.png" if highlight_nodes else None
+    render_figure(path, [graph_panel(G, pos, highlight_nodes, title, node_size=700, highlight_size=900)])
+    show()
 
     return pos
 
 
 def writeoutput(solution, time, m, n, sol_len, approxfactor):
-    fileEmptyCheck = (not os.path.exists("output.csv")) or (
-        os.path.getsize("output.csv") == 0)
-
-    if fileEmptyCheck:
-        with open("output.csv", 'w', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow(["Input size", "Solution", "Solution Length", "Time Taken", "Approximation Factor"])
-            writer.writerow([f"{m},{n}", solution,sol_len, time, approxfactor])
-            
-    else:
-        with open("output.csv", 'a', newline='') as output:
-            writer = csv.writer(output)
-            writer.writerow([f"{m},{n}", solution, sol_len, time, approxfactor])
-
-
-def calculate_approxfactor(index, greedylen , filename="assignment1_output.csv"):
-    
-    fileEmptyCheck = (not os.path.exists(filename)) or (os.path.getsize(filename) == 0)
+    # buffered, see beyondpoly/sink.py
+    return result_sink("output.csv").add({"Input size": f"{m},{n}", "Solution": solution, "Solution Length": sol_len,
+                                   "Time Taken": time, "Approximation Factor": approxfactor})
 
-    if fileEmptyCheck :
-        print(f"error: {filename} not found. .")
-        return
-    
-    optimalsol_len=0
-    with open(filename, 'r') as file:
-        csv_reader = csv.reader(file)
-        csv_reader=list(csv_reader)
-        
-        optimalsol_len=len(ast.literal_eval(csv_reader[index][1])) # GEN AI USED HERE
-    
-    return optimalsol_len ,greedylen/optimalsol_len
-        
 
+def calculate_approxfactor(G, greedylen, filename="assignment1_output.csv"):
+    # optimal size from the baseline store, keyed by the graph itself;
+    # the assignment 1 CSV is imported into the store the first time it is needed
+    optimalsol_len, approxfactor = approximation_factor(G, greedylen, "optimal", legacy_csv=filename)
+    if optimalsol_len is None:
+        print(f"error: no optimal solution recorded for this graph (baseline store or {filename})")
+    return optimalsol_len, approxfactor
 
 
 def main():
-    if os.path.exists("output.csv"):
-        os.remove("output.csv")
+    reset_output("output.csv")
 
     for i in range(1, 5):
         filename = f"input{i}.txt"
-        G = read_graph(filename)
+        new_run()
+        with phase("parse"):
+            G = read_compact_graph(filename)  # CompactGraph; plotting converts it when drawing
         if G is None:
             return
 
 
         print(f"\nGraph from {filename}")
-        pos = plot_graph(G, title="Original Graph") # saving the position of input graph before showing the output
+        with phase("plot"):
+            pos = plot_graph(G, title="Original Graph") # saving the position of input graph before showing the output
         
-        solution, time_taken = greedy_vertex_cover(G)
+        with phase("solve"):
+            if STREAM_MODE:
+                solution, time_taken = stream_vertex_cover(filename)
+            else:
+                solution, time_taken = run_solver(G, greedy_vertex_cover)
         sol_len=len(solution)
         
         print(f"Greedy Vertex Cover: {solution}")
         print(f"Size: {sol_len}, Time: {time_taken}s")
-        optimalsol_len, approxfactor=calculate_approxfactor(i,sol_len)
+        optimalsol_len, approxfactor=calculate_approxfactor(G, sol_len)
+        record(G, "greedy_matching", sol_len, source=filename)
         print(f"optimal solution length from assignment one: {optimalsol_len} ")
         print(f"approximation factor(comparison with prac 1 results): {approxfactor} ")
         
         
-        plot_graph(G, highlight_nodes=solution, title="Graph with Greedy Vertex Cover", pos=pos, number=i)
-
-        if i == 1:
-            writeoutput(solution, time_taken, 10, 10,sol_len,approxfactor)
-        elif i == 2:
-            writeoutput(solution, time_taken, 10, 20,sol_len,approxfactor)
-        elif i == 3:
-            writeoutput(solution, time_taken, 10, 30,sol_len,approxfactor)
-        elif i == 4:
-            writeoutput(solution, time_taken, 10, 40,sol_len,approxfactor)
+        with phase("verify"):
+            chosen = set(solution)
+            if not all(u in chosen or v in chosen for u, v in G.edges()):
+                print("warning: greedy solution is not a vertex cover")
+
+        with phase("plot"):
+            plot_graph(G, highlight_nodes=solution, title="Graph with Greedy Vertex Cover", pos=pos, number=i)
+
+        n, m = read_graph_size(filename)
+        with phase("write"):
+            row = writeoutput(solution, time_taken, n, m, sol_len, approxfactor)
+        row.update(current_run().as_row())  # after the write phase closed, so write_s is in
+
+    close_sinks()
+    dump_profile()
+    wait_for_renders()
 
 
 if __name__ == "__main__":